@@ -36,7 +36,10 @@ def detect_stage_status(item):
             ]
 
     stage2_success = len(stage2_candidates) > 0
-    stage3_success = file_exists(ROOT_DIR, output_dir, "stage3_report.json")
+    stage3_success = (
+        file_exists(ROOT_DIR, output_dir, "stage3_report.json")
+        or file_exists(ROOT_DIR, output_dir, "stage3_report.json.zst")
+    )
     final_contract_success = False
     if output_dir:
         run_dir = ROOT_DIR / output_dir
@@ -1,4 +1,5 @@
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
 
@@ -8,6 +9,10 @@ ROOT_DIR = BASE_DIR.parents[1]
 RESULTS_PATH = BASE_DIR / "llm_results.json"
 OUTPUT_PATH = BASE_DIR / "llm_comparison_summary.json"
 
+# Pipeline reports may be zstd-compressed; reuse the repo-level reader
+sys.path.insert(0, str(ROOT_DIR))
+from fast_json import load_report, resolve_report
+
 
 def load_json(path: Path):
     return json.loads(path.read_text(encoding="utf-8"))
@@ -15,11 +20,11 @@ def load_json(path: Path):
 
 def load_report_issues(item):
     if item["method"] == "pipeline":
-        report_path = ROOT_DIR / item["output_dir"] / "stage3_report.json"
+        report_path = resolve_report(ROOT_DIR / item["output_dir"] / "stage3_report.json")
     else:
         report_path = Path(item["analysis_report_path"])
 
-    report = load_json(report_path)
+    report = load_report(report_path)
     return report.get("initial_analysis", {}).get("issues", [])
 
 
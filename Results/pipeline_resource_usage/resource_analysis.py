@@ -1,4 +1,5 @@
 import json
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -15,6 +16,10 @@ RESOURCE_SUMMARY_FILE = SCRIPT_DIR / "resource_summary.json"
 OUTPUT_DIR = SCRIPT_DIR / "resource_analysis"
 REPORT_FILE = OUTPUT_DIR / "RESOURCE_ANALYSIS_REPORT.md"
 
+# One precompiled template per breakdown row: a single .format call
+# instead of re-parsing the format string for every contract.
+BREAKDOWN_ROW = "| {} | {} | {:.2f} | {:.4f} | {:.4f} | {} | {} | {} |\n"
+
 
 def ensure_output_dir():
     """Create output directory"""
@@ -40,12 +45,13 @@ def load_resource_summary() -> Dict:
 
 def create_detailed_breakdown(results: List[Dict]) -> str:
     """Generate detailed contract breakdown"""
-    text = "\n---\n\n## Detailed Contract Breakdown\n\n"
-    text += "| Contract | Category | Runtime (s) | CPU (s) | Memory (MB) | LOC | Functions | Issues |\n"
-    text += "|----------|----------|-------------|---------|-------------|-----|-----------|--------|\n"
-
-    for r in results:
-        text += "| {} | {} | {:.2f} | {:.4f} | {:.4f} | {} | {} | {} |\n".format(
+    rows = [
+        "\n---\n\n## Detailed Contract Breakdown\n\n",
+        "| Contract | Category | Runtime (s) | CPU (s) | Memory (MB) | LOC | Functions | Issues |\n",
+        "|----------|----------|-------------|---------|-------------|-----|-----------|--------|\n",
+    ]
+    rows.extend(
+        BREAKDOWN_ROW.format(
             r["contract_name"],
             r["category"],
             r["runtime_seconds"],
@@ -55,8 +61,9 @@ def create_detailed_breakdown(results: List[Dict]) -> str:
             r["function_count"],
             r["stage3_issue_count"],
         )
-
-    return text
+        for r in results
+    )
+    return "".join(rows)
 
 
 
@@ -344,14 +351,16 @@ def main():
     plot_scalability_analysis(results, summary)
     plot_security_issues_vs_resources(results)
 
-    print("\n" + "="*100)
-    print("✅ ANALYSIS COMPLETE!")
-    print("="*100)
-    print(f"\n📊 Generated files:")
-    print(f"   📄 {REPORT_FILE.name}")
-    for plot_file in sorted(OUTPUT_DIR.glob("*.png")):
-        print(f"   📈 {plot_file.name}")
-    print("="*100 + "\n")
+    lines = [
+        "\n" + "="*100,
+        "✅ ANALYSIS COMPLETE!",
+        "="*100,
+        "\n📊 Generated files:",
+        f"   📄 {REPORT_FILE.name}",
+    ]
+    lines.extend(f"   📈 {plot_file.name}" for plot_file in sorted(OUTPUT_DIR.glob("*.png")))
+    lines.append("="*100 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
@@ -10,6 +11,10 @@ PIPELINE_RESULTS_PATH = BASE_DIR / "pipeline_results.json"
 MANUAL_RESULTS_PATH = BASE_DIR / "manual_llm_results.json"
 OUTPUT_PATH = BASE_DIR / "result_04_summary.json"
 
+# Pipeline reports may be zstd-compressed; reuse the repo-level reader
+sys.path.insert(0, str(ROOT_DIR))
+from fast_json import load_report, resolve_report
+
 
 def load_json(path: Path):
     return json.loads(path.read_text(encoding="utf-8"))
@@ -61,9 +66,9 @@ def load_report_issues(item, method):
     if method == "manual":
         report_path = Path(item["analysis_report_path"])
     else:
-        report_path = ROOT_DIR / item["output_dir"] / "stage3_report.json"
+        report_path = resolve_report(ROOT_DIR / item["output_dir"] / "stage3_report.json")
 
-    report = load_json(report_path)
+    report = load_report(report_path)
     return report.get("initial_analysis", {}).get("issues", [])
 
 
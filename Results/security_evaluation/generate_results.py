@@ -1,29 +1,82 @@
+import hashlib
 import json
-from collections import Counter, defaultdict
+import os
+import pickle
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 BASE_DIR = Path(__file__).resolve().parent
 ROOT_DIR = BASE_DIR.parents[1]
 PIPELINE_OUTPUTS_DIR = ROOT_DIR / "pipeline_outputs"
 
+# Reports may be written zstd-compressed by run_pipeline; reuse the
+# repo-level reader instead of duplicating the decompression logic
+sys.path.insert(0, str(ROOT_DIR))
+from fast_json import load_report, resolve_report
+
 RESULTS_PATH = BASE_DIR / "security_results.json"
 SUMMARY_PATH = BASE_DIR / "security_summary.json"
 MARKDOWN_PATH = BASE_DIR / "security_summary.md"
+PARSE_CACHE_DIR = BASE_DIR / ".parse_cache"
 
 SEVERITY_KEYS = ["critical", "high", "medium", "low", "info"]
 
 
 def load_json(path: Path):
+    if path.name.endswith(".zst"):
+        return load_report(path)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def dump_json(data):
+    """Serialize to UTF-8 bytes, avoiding a str round-trip on the large exports."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def safe_load_json(path: Path):
+    """Load JSON with an on-disk parse cache keyed on (size, mtime_ns)."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = (stat.st_size, stat.st_mtime_ns)
+    digest = hashlib.blake2b(str(path).encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = PARSE_CACHE_DIR / f"{digest}.pkl"
+
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
     try:
-        return load_json(path)
+        data = load_json(path)
     except Exception:
         return None
 
+    try:
+        PARSE_CACHE_DIR.mkdir(exist_ok=True)
+        with cache_file.open("wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return data
+
 
 def get_contract_path(run_dir: Path):
     final_contracts = sorted(run_dir.glob("final_*.sol"))
@@ -42,18 +95,24 @@ def count_loc(path: Path):
     if not path or not path.exists():
         return 0
 
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    return sum(1 for line in lines if line.strip())
+    with path.open(encoding="utf-8", errors="ignore") as f:
+        return sum(1 for line in f if line.strip())
+
+
+_TITLE_CACHE = {}
 
 
 def normalize_title(issue):
-    title = (issue.get("title") or "unknown").strip().lower()
-    return title or "unknown"
+    raw = issue.get("title") or "unknown"
+    cached = _TITLE_CACHE.get(raw)
+    if cached is None:
+        cached = _TITLE_CACHE.setdefault(raw, sys.intern(raw.strip().lower() or "unknown"))
+    return cached
 
 
 def build_run_record(run_dir: Path):
-    report_path = run_dir / "stage3_report.json"
-    if not report_path.exists():
+    report_path = resolve_report(run_dir / "stage3_report.json")
+    if report_path is None:
         return None
 
     report = safe_load_json(report_path)
@@ -66,7 +125,7 @@ def build_run_record(run_dir: Path):
 
     analysis = final if final else initial
     issues = analysis.get("issues", [])
-    category = metadata.get("category") or metadata.get("base_standard") or "Unknown"
+    category = sys.intern(metadata.get("category") or metadata.get("base_standard") or "Unknown")
     contract_name = (
         analysis.get("contract_name")
         or initial.get("contract_name")
@@ -79,11 +138,8 @@ def build_run_record(run_dir: Path):
     }
     severity["total"] = int(analysis.get("total_issues", sum(severity.values())) or 0)
 
-    tool_counts = Counter()
-    title_counts = Counter()
-    for issue in issues:
-        tool_counts[issue.get("tool") or "unknown"] += 1
-        title_counts[normalize_title(issue)] += 1
+    tool_counts = Counter(sys.intern(issue.get("tool") or "unknown") for issue in issues)
+    title_counts = Counter(map(normalize_title, issues))
 
     contract_path = get_contract_path(run_dir)
 
@@ -109,14 +165,30 @@ def build_run_record(run_dir: Path):
 
 
 def gather_runs():
-    records = []
-    for run_dir in sorted(PIPELINE_OUTPUTS_DIR.iterdir()):
-        if not run_dir.is_dir():
-            continue
-        record = build_run_record(run_dir)
-        if record:
-            records.append(record)
-    return records
+    with os.scandir(PIPELINE_OUTPUTS_DIR) as entries:
+        run_dirs = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        )
+    if not run_dirs:
+        return []
+
+    workers = min(os.cpu_count() or 1, len(run_dirs))
+    if workers <= 1:
+        return [record for record in map(build_run_record, run_dirs) if record]
+
+    # Below this size the runs are I/O bound and process spawn costs more
+    # than it saves; threads still overlap the disk reads.
+    if len(run_dirs) < 256:
+        with ThreadPoolExecutor(max_workers=min(32, len(run_dirs))) as executor:
+            results = executor.map(build_run_record, run_dirs)
+            return [record for record in results if record]
+
+    chunksize = max(1, len(run_dirs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(build_run_record, run_dirs, chunksize=chunksize)
+        return [record for record in results if record]
 
 
 def build_summary(records):
@@ -125,51 +197,57 @@ def build_summary(records):
     analyzed_runs = len(analyzed)
 
     severity_totals = {key: 0 for key in SEVERITY_KEYS + ["total"]}
-    category_stats = defaultdict(lambda: {"contracts": 0, "issues": 0, "high": 0, "medium": 0})
+    category_stats = Counter()
     tool_totals = Counter()
     title_totals = Counter()
 
     contracts_with_findings = 0
     contracts_improved = 0
     total_resolved = 0
+    total_initial_issues = 0
+    total_final_issues = 0
 
     for record in analyzed:
-        total_resolved += record["issues_resolved"]
-        if record["severity"]["total"] > 0:
+        resolved = record["issues_resolved"]
+        initial_total = record["initial_total_issues"]
+        final_total = record["final_total_issues"]
+        severity = record["severity"]
+
+        total_resolved += resolved
+        total_initial_issues += initial_total
+        total_final_issues += final_total
+        if severity["total"] > 0:
             contracts_with_findings += 1
-        if record["issues_resolved"] > 0 or record["final_total_issues"] < record["initial_total_issues"]:
+        if resolved > 0 or final_total < initial_total:
             contracts_improved += 1
 
-        for key, value in record["severity"].items():
+        for key, value in severity.items():
             severity_totals[key] += value
 
-        category = category_stats[record["category"]]
-        category["contracts"] += 1
-        category["issues"] += record["severity"]["total"]
-        category["high"] += record["severity"]["high"]
-        category["medium"] += record["severity"]["medium"]
+        category = record["category"]
+        category_stats[(category, "contracts")] += 1
+        category_stats[(category, "issues")] += severity["total"]
+        category_stats[(category, "high")] += severity["high"]
+        category_stats[(category, "medium")] += severity["medium"]
 
-        for tool, count in record["tool_issue_counts"].items():
-            tool_totals[tool] += count
-        for issue in record["top_issue_titles"]:
-            title_totals[issue["title"]] += issue["count"]
+        tool_totals.update(record["tool_issue_counts"])
+        title_totals.update({issue["title"]: issue["count"] for issue in record["top_issue_titles"]})
 
-    avg_initial_issues = round(sum(item["initial_total_issues"] for item in analyzed) / analyzed_runs, 2) if analyzed_runs else 0.0
+    avg_initial_issues = round(total_initial_issues / analyzed_runs, 2) if analyzed_runs else 0.0
     avg_total_issues = round(severity_totals["total"] / analyzed_runs, 2) if analyzed_runs else 0.0
-    avg_final_issues = round(sum(item["final_total_issues"] for item in analyzed) / analyzed_runs, 2) if analyzed_runs else 0.0
-    total_initial_issues = sum(item["initial_total_issues"] for item in analyzed)
+    avg_final_issues = round(total_final_issues / analyzed_runs, 2) if analyzed_runs else 0.0
     fix_rate = round((total_resolved / total_initial_issues) * 100, 2) if total_initial_issues else 0.0
 
     category_summary = []
-    for name, stats in sorted(category_stats.items()):
-        contracts = stats["contracts"]
+    for name in sorted({category for category, _ in category_stats}):
+        contracts = category_stats[(name, "contracts")]
         category_summary.append(
             {
                 "category": name,
                 "contracts": contracts,
-                "avg_total_issues": round(stats["issues"] / contracts, 2) if contracts else 0.0,
-                "avg_high": round(stats["high"] / contracts, 2) if contracts else 0.0,
-                "avg_medium": round(stats["medium"] / contracts, 2) if contracts else 0.0,
+                "avg_total_issues": round(category_stats[(name, "issues")] / contracts, 2) if contracts else 0.0,
+                "avg_high": round(category_stats[(name, "high")] / contracts, 2) if contracts else 0.0,
+                "avg_medium": round(category_stats[(name, "medium")] / contracts, 2) if contracts else 0.0,
             }
         )
 
@@ -244,13 +322,15 @@ def main():
     records = gather_runs()
     summary = build_summary(records)
 
-    RESULTS_PATH.write_text(json.dumps(records, indent=2), encoding="utf-8")
-    SUMMARY_PATH.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    RESULTS_PATH.write_bytes(dump_json(records))
+    SUMMARY_PATH.write_bytes(dump_json(summary))
     write_markdown(summary)
 
-    print(f"Saved {RESULTS_PATH}")
-    print(f"Saved {SUMMARY_PATH}")
-    print(f"Saved {MARKDOWN_PATH}")
+    sys.stdout.write(
+        f"Saved {RESULTS_PATH}\n"
+        f"Saved {SUMMARY_PATH}\n"
+        f"Saved {MARKDOWN_PATH}\n"
+    )
 
 
 if __name__ == "__main__":
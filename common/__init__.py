@@ -0,0 +1 @@
+"""Shared utilities used by more than one pipeline stage"""
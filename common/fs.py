@@ -0,0 +1,18 @@
+"""Filesystem helpers shared by the pipeline drivers"""
+
+from pathlib import Path
+
+# Directories already created this process; repeated ensure_dir calls on
+# the same path (every run in a batch shares the same output base) cost a
+# set lookup instead of a mkdir syscall.
+_ensured = set()
+
+
+def ensure_dir(path) -> Path:
+    """mkdir -p that remembers what it already created"""
+    path = Path(path)
+    key = str(path)
+    if key not in _ensured:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured.add(key)
+    return path
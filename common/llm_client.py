@@ -0,0 +1,125 @@
+"""
+Shared LLM response cache for Stage 1 and Stage 2 V2.
+
+Both stages send deterministic prompts (temperature 0 or fixed) whose
+responses are safe to reuse, so identical (model, messages, params)
+requests are served from memory first and then from pickled responses
+under .llm_cache/ instead of hitting the API again. Set
+LLM_CACHE_DISABLE=1 to bypass.
+"""
+
+import json
+import os
+import pickle
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx ships with openai
+    httpx = None
+
+CACHE_DIR = Path(".llm_cache")
+
+# One OpenAI client (and therefore one HTTP connection pool) per process;
+# each stage previously built its own client, paying TCP + TLS setup per
+# pool instead of reusing keep-alive connections across the pipeline
+_OPENAI_CLIENT = None
+
+
+def get_openai_client(api_key: str):
+    """Return the process-wide OpenAI client, creating it on first use.
+
+    The client is backed by a pooled httpx transport (HTTP/2 when the h2
+    extra is installed) so batch runs multiplex requests over a few
+    keep-alive connections instead of opening one per call. The api_key
+    from the first caller wins; all stages read the same env vars.
+    """
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        from openai import OpenAI
+
+        http_client = None
+        if httpx is not None:
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            try:
+                http_client = httpx.Client(http2=True, limits=limits)
+            except ImportError:
+                # h2 not installed; pooling still applies over HTTP/1.1
+                http_client = httpx.Client(limits=limits)
+        if http_client is not None:
+            _OPENAI_CLIENT = OpenAI(api_key=api_key, http_client=http_client)
+        else:
+            _OPENAI_CLIENT = OpenAI(api_key=api_key)
+    return _OPENAI_CLIENT
+
+# In-process layer: repeated calls within one run (or one batch) never
+# touch the disk. Bounded LRU so long batch sessions don't grow unbounded.
+_MEM_CACHE: OrderedDict = OrderedDict()
+_MEM_CACHE_MAX = 1024
+
+
+def cache_disabled() -> bool:
+    return os.getenv("LLM_CACHE_DISABLE") == "1"
+
+
+def cache_key(model: str, messages: list, **params) -> str:
+    """Stable digest of everything that influences the model output"""
+    payload = json.dumps(
+        {"m": model, "msgs": messages, "p": params},
+        sort_keys=True, default=str,
+    )
+    return blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _remember(key: str, response):
+    _MEM_CACHE[key] = response
+    _MEM_CACHE.move_to_end(key)
+    while len(_MEM_CACHE) > _MEM_CACHE_MAX:
+        _MEM_CACHE.popitem(last=False)
+
+
+def load_cached_response(key: str):
+    """Return the cached response for key, or None on miss/corruption"""
+    if key in _MEM_CACHE:
+        _MEM_CACHE.move_to_end(key)
+        return _MEM_CACHE[key]
+    try:
+        with open(CACHE_DIR / f"{key}.pkl", "rb") as f:
+            response = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    _remember(key, response)
+    return response
+
+
+def store_response(key: str, response):
+    """Best-effort write; a failed cache write never fails the LLM call"""
+    _remember(key, response)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(CACHE_DIR / f"{key}.pkl", "wb") as f:
+            pickle.dump(response, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def chat_completion_cached(client, model: str, messages: list, **kwargs):
+    """
+    Drop-in cached replacement for client.chat.completions.create.
+
+    timeout is excluded from the key because it never changes the output.
+    """
+    if cache_disabled():
+        return client.chat.completions.create(model=model, messages=messages, **kwargs)
+
+    key_params = {k: v for k, v in kwargs.items() if k != "timeout"}
+    key = cache_key(model, messages, **key_params)
+    cached = load_cached_response(key)
+    if cached is not None:
+        return cached
+
+    response = client.chat.completions.create(model=model, messages=messages, **kwargs)
+    store_response(key, response)
+    return response
@@ -0,0 +1,14 @@
+"""Unique, sortable run identifiers for pipeline output directories"""
+
+import time
+
+
+def run_id() -> str:
+    """
+    Human-readable timestamp plus a monotonic-ns suffix.
+
+    time.strftime on the C struct is noticeably faster than
+    datetime.now().strftime, and the suffix keeps names unique when several
+    runs (e.g. concurrent batch pipelines) start within the same second.
+    """
+    return f"{time.strftime('%Y-%m-%d_%H-%M-%S')}_{time.monotonic_ns() % 1_000_000:06d}"
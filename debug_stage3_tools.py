@@ -5,6 +5,9 @@ Debug script to check why Slither and Mythril aren't finding issues
 import json
 from stage_3 import run_stage3
 
+# Section separator, built once instead of per print
+SEP = "=" * 80
+
 # Test with a known vulnerable contract
 TEST_CONTRACT = """
 // SPDX-License-Identifier: MIT
@@ -47,15 +50,15 @@ contract VulnerableContract {
 """
 
 def main():
-    print("="*80)
+    print(SEP)
     print("DEBUGGING STAGE 3 TOOLS")
-    print("="*80)
+    print(SEP)
     print("\nTesting with a known vulnerable contract...")
     print("Expected vulnerabilities:")
     print("  - Reentrancy in withdraw()")
     print("  - tx.origin usage in transferOwnership()")
     print("  - Unchecked send in sendFunds()")
-    print("\n" + "="*80)
+    print("\n" + SEP)
     
     # Run with verbose mode (we need to modify runner to support this)
     # For now, let's manually create analyzer with verbose=True
@@ -72,9 +75,9 @@ def main():
         timeout=120
     )
     
-    print("\n" + "="*80)
+    print("\n" + SEP)
     print("ANALYSIS RESULTS")
-    print("="*80)
+    print(SEP)
     print(f"Success: {result.success}")
     print(f"Tools used: {result.tools_used}")
     print(f"Total issues found: {len(result.issues)}")
@@ -96,9 +99,9 @@ def main():
         print("  4. Tools are configured incorrectly")
     
     # Also test with the actual pipeline
-    print("\n" + "="*80)
+    print("\n" + SEP)
     print("TESTING WITH FULL PIPELINE")
-    print("="*80)
+    print(SEP)
     
     pipeline_result = run_stage3(
         solidity_code=TEST_CONTRACT,
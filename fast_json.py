@@ -0,0 +1,89 @@
+"""
+Fast pretty-printed JSON serialization for pipeline artifacts.
+
+Stage 2 metadata and stage3 reports can span thousands of nodes; stdlib
+json with indent=2 pretty-prints them in pure Python. orjson does the same
+in native code (typically 5-10x faster), so use it when installed and fall
+back to stdlib otherwise.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Large reports are written zstd-compressed when the library is installed
+# (5-10x smaller at hundreds of MB/s); otherwise plain JSON
+REPORT_SUFFIX = ".json.zst" if zstandard is not None else ".json"
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize obj to 2-space-indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def dumps_pretty(obj) -> str:
+    """Serialize obj to a 2-space-indented JSON string"""
+    return _dumps_bytes(obj).decode("utf-8")
+
+
+def dump_pretty(obj, path):
+    """Serialize obj and write it to path in one call.
+
+    Writes the serializer's bytes directly instead of decoding to str and
+    re-encoding through a text-mode file handle.
+    """
+    Path(path).write_bytes(_dumps_bytes(obj))
+
+
+def dump_report(obj, path):
+    """
+    Write a potentially large JSON report.
+
+    Stage 3 reports (full tool traces x iterations) can run to MBs; when
+    zstandard is installed the bytes are compressed before hitting disk.
+    `path` should carry REPORT_SUFFIX so readers can tell the two apart.
+    """
+    data = _dumps_bytes(obj)
+    if zstandard is not None and str(path).endswith(".zst"):
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+    Path(path).write_bytes(data)
+
+
+def resolve_report(path):
+    """Locate a report on disk, plain or zstd-compressed.
+
+    Callers name the plain ``.json`` form; when only the compressed
+    sibling exists (runs written with zstandard installed), that path is
+    returned instead. Returns None when neither variant exists.
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+    if not path.name.endswith(".zst"):
+        compressed = path.with_name(path.name + ".zst")
+        if compressed.exists():
+            return compressed
+    return None
+
+
+def load_report(path):
+    """Read a report written by dump_report, compressed or not"""
+    data = Path(path).read_bytes()
+    if str(path).endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(
+                f"{path} is zstd-compressed but the zstandard library is not installed"
+            )
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return json.loads(data)
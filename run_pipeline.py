@@ -1,15 +1,24 @@
+import asyncio
+import io
 import os
-import json
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 
-from stage_1.intent_extraction import extract_intent
-from stage_2_v2.generator_v2 import generate_solidity_v2
-from stage_3 import run_stage3
+from common.fs import ensure_dir
+from common.run_id import run_id
+from fast_json import REPORT_SUFFIX, dump_report, dumps_pretty
 
+# Stage modules pull in the OpenAI/docker client stacks (1-3s of import
+# time); they are imported lazily inside run_full_pipeline so --help and
+# argument validation stay instant.
 
 
+# Section separators, built once instead of per print
+SEP = "=" * 80
+DASH = "-" * 80
+
 USER_INPUT = """A lottery contract that picks a winner using block.timestamp for randomness."""
 
 # Stage 3 Configuration
@@ -21,30 +30,62 @@ STAGE3_CONFIG = {
 }
 
 
-def ensure(path: str):
-    os.makedirs(path, exist_ok=True)
+# Artifact writes go through a small thread pool so the disk syscalls
+# overlap the LLM/analysis work instead of blocking the main thread.
+_WRITER_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _write_file(path: Path, data: str):
+    path.write_text(data)
+
+
+def _submit_write(pending: list, path: Path, data: str):
+    """Serialize in the caller, hand only the blocking write to the pool"""
+    pending.append((path, _WRITER_POOL.submit(_write_file, path, data)))
+
 
-def run_full_pipeline(user_input: str, stage3_options: dict):
-    print("\n" + "="*80)
+def _drain_writes(pending: list):
+    """Block until all background writes finish and report any failures.
+
+    wait() alone never surfaces worker exceptions, so without this a
+    failed artifact write would be silently dropped while the pipeline
+    reports success.
+    """
+    wait([future for _, future in pending])
+    ok = True
+    for path, future in pending:
+        exc = future.exception()
+        if exc is not None:
+            ok = False
+            print(f"❌ Failed to write {path}: {exc}")
+    return ok
+
+
+def run_full_pipeline(user_input: str, stage3_options: dict, spec: dict = None):
+    print("\n" + SEP)
     print("RUNNING FULL PIPELINE (Stage 1 → Stage 2 → Stage 3)")
-    print("="*80)
+    print(SEP)
     print("\n📝 USER INPUT:")
     print(user_input)
-    print("\n" + "-"*80)
+    print("\n" + DASH)
     
-    # Create output directory
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    outdir = f"pipeline_outputs/{timestamp}"
-    ensure(outdir)
+    # Create output directory (the shared parent is memoized, so batch runs
+    # only pay one mkdir for the new leaf)
+    outdir = ensure_dir("pipeline_outputs") / run_id()
+    outdir.mkdir(exist_ok=True)
     
     # ------------------------------------------------------------------  
     # Stage 1 — Intent Extraction  
     # ------------------------------------------------------------------
     print("\n[1/3] Stage 1: Extracting contract intent...")
-    print("-" * 80)
+    print(DASH)
     try:
-        spec = extract_intent(user_input)
-        print("✅ Stage 1 complete!")
+        if spec is None:
+            from stage_1.intent_extraction import extract_intent
+            spec = extract_intent(user_input)
+            print("✅ Stage 1 complete!")
+        else:
+            print("✅ Stage 1 complete! (spec pre-extracted via batch)")
         print(f"\n📋 Contract Specification:")
         print(f"   • Contract Name: {spec.get('contract_name', 'Unknown')}")
         print(f"   • Contract Type: {spec.get('contract_type', 'Unknown')}")
@@ -57,47 +98,64 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
         traceback.print_exc()
         return None
     
-    # Save Stage 1 output
-    with open(f"{outdir}/stage1_spec.json", "w") as f:
-        json.dump(spec, f, indent=2)
-    print(f"   📄 Saved: {outdir}/stage1_spec.json")
+    # Build every artifact path once, up front
+    contract_name = spec.get('contract_name', 'Contract')
+    spec_path, sol_path, meta_path, final_sol_path, report_path = (
+        outdir / name
+        for name in (
+            "stage1_spec.json",
+            f"{contract_name}.sol",
+            "metadata.json",
+            f"final_{contract_name}.sol",
+            f"stage3_report{REPORT_SUFFIX}",
+        )
+    )
+
+    # Save Stage 1 output (write overlaps Stage 2's LLM call)
+    pending_writes = []
+    _submit_write(pending_writes, spec_path, dumps_pretty(spec))
+    print(f"   📄 Saved: {spec_path}")
     
     # ------------------------------------------------------------------  
     # Stage 2 V2 — LLM-Powered Solidity Generation  
     # ------------------------------------------------------------------
     print("\n[2/3] Stage 2 V2: LLM-Powered Solidity Generation...")
-    print("-" * 80)
+    print(DASH)
     try:
+        from stage_2_v2.generator_v2 import generate_solidity_v2
         stage2_result = generate_solidity_v2(user_input, spec, debug=False)
         print("✅ Stage 2 V2 complete!")
     except Exception as e:
         print(f"❌ Stage 2 Failed: {e}")
         import traceback
         traceback.print_exc()
+        _drain_writes(pending_writes)
         return None
     
     # Save Stage 2 outputs
-    contract_name = spec.get('contract_name', 'Contract')
-    sol_path = f"{outdir}/{contract_name}.sol"
-    meta_path = f"{outdir}/metadata.json"
-    
-    with open(sol_path, "w") as f:
-        f.write(stage2_result.solidity_code)
-    
-    with open(meta_path, "w") as f:
-        json.dump(stage2_result.to_metadata_dict(), f, indent=2)
+    # Build the metadata dict once; it is reused for Stage 3 below
+    stage2_metadata = stage2_result.to_metadata_dict()
+
+    _submit_write(pending_writes, sol_path, stage2_result.solidity_code)
+    _submit_write(pending_writes, meta_path, dumps_pretty(stage2_metadata))
     
     print(f"\n📦 Stage 2 outputs saved:")
     print(f"   • Solidity: {sol_path}")
     print(f"   • Metadata: {meta_path}")
     
-    # Show contract preview
-    lines = stage2_result.solidity_code.split('\n')
-    print(f"\n📄 Contract Preview (first 20 lines):")
-    for i, line in enumerate(lines[:20], 1):
-        print(f"   {i:3d} | {line}")
-    if len(lines) > 20:
-        print(f"   ... ({len(lines) - 20} more lines)")
+    # Show contract preview (one buffered write instead of a print per
+    # line; islice stops at the 20th newline instead of splitting the
+    # whole contract into a line list)
+    total_lines = stage2_result.solidity_code.count('\n') + 1
+    preview = [f"\n📄 Contract Preview (first 20 lines):"]
+    first_lines = islice(io.StringIO(stage2_result.solidity_code), 20)
+    preview.extend(
+        f"   {i:3d} | {line}"
+        for i, line in enumerate((l.rstrip("\n") for l in first_lines), 1)
+    )
+    if total_lines > 20:
+        preview.append(f"   ... ({total_lines - 20} more lines)")
+    sys.stdout.write("\n".join(preview) + "\n")
     
     # ------------------------------------------------------------------  
     # Stage 3 — Security Analysis & Auto-Fix  
@@ -106,13 +164,15 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
     if stage3_options.get("enable_stage3", True):
         print("\n[3/3] Stage 3: Security Analysis" + 
               (" & Auto-Fix" if not stage3_options.get("skip_auto_fix", False) else ""))
-        print("-" * 80)
+        print(DASH)
         
         try:
-            # Add verbose flag to metadata for Stage 3
-            stage2_metadata = stage2_result.to_metadata_dict()
+            from stage_3 import run_stage3
+
+            # Add verbose flag to metadata for Stage 3 (metadata.json is
+            # already on disk, so the extra key never reaches it)
             stage2_metadata["_verbose"] = stage3_options.get("verbose", False)
-            
+
             stage3_result = run_stage3(
                 solidity_code=stage2_result.solidity_code,
                 contract_name=contract_name,
@@ -122,18 +182,16 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
                 skip_auto_fix=stage3_options.get("skip_auto_fix", False)
             )
             
-            # Save Stage 3 outputs
-            final_sol_path = f"{outdir}/final_{contract_name}.sol"
-            with open(final_sol_path, "w") as f:
-                f.write(stage3_result.final_code)
-            
-            stage3_report_path = f"{outdir}/stage3_report.json"
-            with open(stage3_report_path, "w") as f:
-                json.dump(stage3_result.to_dict(), f, indent=2)
-            
+            # Save Stage 3 outputs. The report is serialized/compressed on
+            # the writer pool; stage3_result is not mutated after this point
+            _submit_write(pending_writes, final_sol_path, stage3_result.final_code)
+            pending_writes.append(
+                (report_path, _WRITER_POOL.submit(dump_report, stage3_result.to_dict(), report_path))
+            )
+
             print(f"\n📦 Stage 3 outputs saved:")
             print(f"   • Fixed Contract: {final_sol_path}")
-            print(f"   • Security Report: {stage3_report_path}")
+            print(f"   • Security Report: {report_path}")
             
             # Show summary
             print(f"\n📊 Stage 3 Summary:")
@@ -144,15 +202,17 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
             print(f"   • Issues resolved: {stage3_result.issues_resolved}")
             print(f"   • Iterations: {stage3_result.iterations}")
             
-            # Show severity breakdown
+            # Show severity breakdown (single pass over the issue list)
             if initial_issues > 0:
                 from stage_3.models import Severity
-                print(f"\n   Issue Breakdown (Initial):")
-                print(f"     - Critical: {len(stage3_result.initial_analysis.get_by_severity(Severity.CRITICAL))}")
-                print(f"     - High: {len(stage3_result.initial_analysis.get_by_severity(Severity.HIGH))}")
-                print(f"     - Medium: {len(stage3_result.initial_analysis.get_by_severity(Severity.MEDIUM))}")
-                print(f"     - Low: {len(stage3_result.initial_analysis.get_by_severity(Severity.LOW))}")
-                print(f"     - Info: {len(stage3_result.initial_analysis.get_by_severity(Severity.INFO))}")
+                counts = stage3_result.initial_analysis.severity_counts()
+                sys.stdout.write("\n".join(
+                    [f"\n   Issue Breakdown (Initial):"] + [
+                        f"     - {severity.value.capitalize()}: {counts[severity]}"
+                        for severity in (Severity.CRITICAL, Severity.HIGH,
+                                         Severity.MEDIUM, Severity.LOW, Severity.INFO)
+                    ]
+                ) + "\n")
         
         except Exception as e:
             print(f"⚠️  Stage 3 Failed: {e}")
@@ -163,20 +223,26 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
     else:
         print("\n[3/3] Stage 3: Skipped")
     
-    # ------------------------------------------------------------------  
+    # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
-    print("\n" + "="*80)
-    print("✅ PIPELINE COMPLETE")
-    print("="*80)
-    print(f"\n📁 All outputs saved in: {outdir}")
-    print(f"\n📋 Files generated:")
-    print(f"   • stage1_spec.json - Intent specification")
-    print(f"   • {contract_name}.sol - Generated contract")
-    print(f"   • metadata.json - Stage 2 metadata")
+    writes_ok = _drain_writes(pending_writes)
+    summary = [
+        "\n" + SEP,
+        "✅ PIPELINE COMPLETE",
+        SEP,
+        f"\n📁 All outputs saved in: {outdir}",
+        f"\n📋 Files generated:",
+        f"   • stage1_spec.json - Intent specification",
+        f"   • {contract_name}.sol - Generated contract",
+        f"   • metadata.json - Stage 2 metadata",
+    ]
     if stage3_result:
-        print(f"   • final_{contract_name}.sol - Security-fixed contract")
-        print(f"   • stage3_report.json - Security analysis report")
+        summary.append(f"   • final_{contract_name}.sol - Security-fixed contract")
+        summary.append(f"   • {report_path.name} - Security analysis report")
+    if not writes_ok:
+        summary.append(f"\n⚠️  Some files failed to write — see errors above")
+    sys.stdout.write("\n".join(summary) + "\n")
     
     return {
         "output_dir": outdir,
@@ -186,6 +252,38 @@ def run_full_pipeline(user_input: str, stage3_options: dict):
     }
 
 
+def run_batch_pipeline(user_inputs: list, stage3_options: dict, max_concurrency: int = 4):
+    """
+    Run the full pipeline over a batch of user inputs concurrently.
+
+    The pipeline is I/O-bound on LLM API latency, so overlapping runs turns
+    wall time from O(N * latency) into roughly O(latency) for the LLM stages.
+    Concurrency is bounded by a semaphore to respect API rate limits.
+    """
+    return asyncio.run(_run_batch(user_inputs, stage3_options, max_concurrency))
+
+
+async def _run_batch(user_inputs: list, stage3_options: dict, max_concurrency: int):
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(user_input: str):
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(run_full_pipeline, user_input, stage3_options)
+            except Exception as e:
+                print(f"❌ Batch item failed: {e}")
+                return None
+
+    tasks = [asyncio.create_task(run_one(user_input)) for user_input in user_inputs]
+    results = await asyncio.gather(*tasks)
+
+    completed = sum(1 for r in results if r)
+    print("\n" + SEP)
+    print(f"BATCH COMPLETE: {completed}/{len(user_inputs)} pipelines succeeded")
+    print(SEP)
+    return results
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -225,16 +323,112 @@ Examples:
         type=int,
         help="Maximum fix iterations (overrides STAGE3_CONFIG)"
     )
-    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass all on-disk caches (Stage 1 intent, shared LLM responses, "
+             "Stage 3 results and the known-clean registry)"
+    )
+    parser.add_argument(
+        "--batch-file",
+        type=str,
+        help="File with one contract description per line; Stage 1 runs "
+             "through the OpenAI Batch API (cheaper, but up to 24h turnaround)"
+    )
+    parser.add_argument(
+        "--inputs-file",
+        type=str,
+        help="File with one contract description per line; pipelines run "
+             "concurrently in-process (see --jobs)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Concurrent pipelines for --inputs-file (default: 4)"
+    )
+
     args = parser.parse_args()
-    
+
+    if args.no_cache:
+        os.environ["INTENT_CACHE_DISABLE"] = "1"
+        os.environ["LLM_CACHE_DISABLE"] = "1"
+        os.environ["STAGE3_CACHE_DISABLE"] = "1"
+
     try:
+        # Get Stage 3 options (command-line args override config)
+        stage3_options = STAGE3_CONFIG.copy()
+
+        if args.skip_stage3:
+            stage3_options["enable_stage3"] = False
+        elif args.analysis_only:
+            stage3_options["enable_stage3"] = True
+            stage3_options["skip_auto_fix"] = True
+            stage3_options["max_iterations"] = 1
+
+        if args.max_iterations:
+            stage3_options["max_iterations"] = args.max_iterations
+
+        # Concurrent mode: run N full pipelines at once; concurrency is
+        # bounded by --jobs to respect API rate limits
+        if args.inputs_file:
+            inputs = [
+                line.strip()
+                for line in Path(args.inputs_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            if not inputs:
+                print(f"❌ No inputs found in {args.inputs_file}")
+                sys.exit(1)
+
+            print("\n" + SEP)
+            print("SMART CONTRACT PIPELINE (CONCURRENT MODE)")
+            print(SEP)
+            print(f"\n📝 {len(inputs)} inputs from {args.inputs_file}, {args.jobs} at a time")
+
+            results = run_batch_pipeline(inputs, stage3_options, max_concurrency=args.jobs)
+            sys.exit(0 if any(results) else 1)
+
+        # Batch mode: Stage 1 for all inputs via the Batch API, then
+        # Stages 2-3 per returned spec
+        if args.batch_file:
+            from stage_1.intent_extraction_batch import extract_intent_batch
+
+            inputs = [
+                line.strip()
+                for line in Path(args.batch_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            if not inputs:
+                print(f"❌ No inputs found in {args.batch_file}")
+                sys.exit(1)
+
+            print("\n" + SEP)
+            print("SMART CONTRACT PIPELINE (BATCH MODE)")
+            print(SEP)
+            print(f"\n📝 {len(inputs)} inputs from {args.batch_file}")
+
+            specs = extract_intent_batch(inputs)
+
+            completed = 0
+            for user_input, spec in zip(inputs, specs):
+                if spec is None:
+                    print(f"⚠️  Skipping input without a spec: {user_input[:60]}")
+                    continue
+                if run_full_pipeline(user_input, stage3_options, spec=spec):
+                    completed += 1
+
+            print("\n" + SEP)
+            print(f"BATCH COMPLETE: {completed}/{len(inputs)} pipelines succeeded")
+            print(SEP)
+            return
+
         # Get user input (use command-line arg if provided, otherwise use variable)
         if args.input:
             user_input = args.input
-            print("\n" + "="*80)
+            print("\n" + SEP)
             print("SMART CONTRACT PIPELINE")
-            print("="*80)
+            print(SEP)
             print(f"\n📝 Input (from command-line): {user_input}")
         else:
             user_input = USER_INPUT
@@ -242,24 +436,11 @@ Examples:
                 print("❌ USER_INPUT is empty. Please edit the USER_INPUT variable in run_pipeline.py")
                 print("   Or use --input flag: python run_pipeline.py --input 'Your description'")
                 sys.exit(1)
-            print("\n" + "="*80)
+            print("\n" + SEP)
             print("SMART CONTRACT PIPELINE")
-            print("="*80)
+            print(SEP)
             print(f"\n📝 Input (from USER_INPUT variable): {user_input}")
-        
-        # Get Stage 3 options (command-line args override config)
-        stage3_options = STAGE3_CONFIG.copy()
-        
-        if args.skip_stage3:
-            stage3_options["enable_stage3"] = False
-        elif args.analysis_only:
-            stage3_options["enable_stage3"] = True
-            stage3_options["skip_auto_fix"] = True
-            stage3_options["max_iterations"] = 1
-        
-        if args.max_iterations:
-            stage3_options["max_iterations"] = args.max_iterations
-        
+
         print(f"\n⚙️  Stage 3 Config:")
         print(f"   • Enable Stage 3: {stage3_options['enable_stage3']}")
         if stage3_options['enable_stage3']:
@@ -270,14 +451,14 @@ Examples:
         result = run_full_pipeline(user_input, stage3_options)
         
         if result:
-            print("\n" + "="*80)
+            print("\n" + SEP)
             if result.get("stage3_result"):
                 print("✅ Pipeline completed successfully!")
                 print(f"📄 Final secure contract: {result['output_dir']}/final_{result['spec']['contract_name']}.sol")
             else:
                 print("✅ Pipeline completed (Stage 3 skipped or failed)")
                 print(f"📄 Generated contract: {result['output_dir']}/{result['spec']['contract_name']}.sol")
-            print("="*80)
+            print(SEP)
         else:
             print("\n❌ Pipeline failed. Check errors above.")
             sys.exit(1)
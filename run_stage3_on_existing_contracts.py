@@ -8,7 +8,9 @@ stage3_report.json files yet, running Stage 3 security analysis on them.
 
 import json
 import os
+import traceback
 from pathlib import Path
+from fast_json import resolve_report
 from stage_3 import run_stage3
 
 
@@ -43,12 +45,12 @@ def get_contract_name(sol_file: Path, metadata_file: Path) -> str:
     return sol_file.stem
 
 
-def process_contract_directory(contract_dir: Path, skip_auto_fix: bool = True):
+def process_contract_directory(contract_dir: Path, skip_auto_fix: bool = True, verbose: bool = False):
     """Process a single contract directory"""
     stage3_report = contract_dir / "stage3_report.json"
     
-    # Skip if already processed
-    if stage3_report.exists():
+    # Skip if already processed (plain or zstd-compressed report)
+    if resolve_report(stage3_report):
         print(f"⏭️  Skipping {contract_dir.name} (already has stage3_report.json)")
         return True
     
@@ -108,8 +110,10 @@ def process_contract_directory(contract_dir: Path, skip_auto_fix: bool = True):
         
     except Exception as e:
         print(f"❌ Error processing {contract_dir.name}: {e}")
-        import traceback
-        traceback.print_exc()
+        # Formatting the full stack per failure is expensive when many
+        # contracts fail the same way; only do it on request
+        if verbose:
+            traceback.print_exc()
         return False
 
 
@@ -136,6 +140,11 @@ def main():
         type=int,
         help="Limit number of contracts to process (for testing)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print full tracebacks for failed contracts"
+    )
     
     args = parser.parse_args()
     
@@ -175,11 +184,11 @@ def main():
     for i, contract_dir in enumerate(contract_dirs, 1):
         print(f"\n[{i}/{len(contract_dirs)}] {contract_dir.name}")
         
-        if (contract_dir / "stage3_report.json").exists():
+        if resolve_report(contract_dir / "stage3_report.json"):
             skip_count += 1
             continue
         
-        if process_contract_directory(contract_dir, skip_auto_fix=args.skip_auto_fix):
+        if process_contract_directory(contract_dir, skip_auto_fix=args.skip_auto_fix, verbose=args.verbose):
             success_count += 1
         else:
             error_count += 1
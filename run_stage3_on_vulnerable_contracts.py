@@ -1,64 +1,100 @@
-import json
+import logging
+import os
 import re
-from datetime import datetime
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+from common.fs import ensure_dir
+from common.run_id import run_id
+from fast_json import dump_pretty
 from stage_3 import run_stage3
 
+# Section separator, built once instead of per print
+SEP = "=" * 80
 
-def extract_contract_name(solidity_code: str) -> str:
-    match = re.search(r'contract\s+(\w+)', solidity_code)
-    if match:
-        return match.group(1)
-    
-    return "UnknownContract"
+# Lazy %-formatting defers string building until the record is emitted,
+# and log.exception replaces the per-error traceback import/format pair
+log = logging.getLogger(__name__)
+
+# Vulnerability keywords in priority order: the highest-priority keyword
+# present anywhere in the source wins
+_VULN_KEYWORDS = (
+    ("reentrancy", ("Reentrancy", "High")),
+    ("access control", ("Access Control", "Critical")),
+    ("tx.origin", ("tx.origin Usage", "Medium")),
+    ("random", ("Weak Randomness", "Medium")),
+)
+
+# One combined pattern extracts everything in a single walk over the
+# source: contract name, SWC id, and vulnerability keywords (the latter
+# case-insensitive via a scoped flag group). Dispatch on m.lastgroup.
+_METADATA_RE = re.compile(
+    r"contract\s+(?P<contract>\w+)"
+    r"|(?P<swc>SWC-\d+)"
+    r"|(?i:(?P<kw>" + "|".join(re.escape(k) for k, _ in _VULN_KEYWORDS) + r"))"
+)
+
+# Bit per keyword, ordered so that bit index == priority rank: the
+# winning keyword is simply the lowest set bit of the accumulated mask
+_KEYWORD_BIT = {k: 1 << i for i, (k, _) in enumerate(_VULN_KEYWORDS)}
+
+# Filename hints share the priority table above; one compiled alternation
+# scan replaces the old chain of substring checks, with the bitmask
+# keeping chain order authoritative when several hints appear
+_FILENAME_BIT = {
+    "reentrancy": _KEYWORD_BIT["reentrancy"],
+    "unprotected": _KEYWORD_BIT["access control"],
+    "vault": _KEYWORD_BIT["access control"],
+    "phish": _KEYWORD_BIT["tx.origin"],
+    "lottery": _KEYWORD_BIT["random"],
+    "bad": _KEYWORD_BIT["random"],
+}
+_FILENAME_RE = re.compile("|".join(_FILENAME_BIT))
 
 
-def extract_vulnerability_info(solidity_code: str, filename: str) -> Dict:
+def extract_all_metadata(solidity_code: str, filename: str) -> Tuple[str, Dict]:
+    """Extract contract name and vulnerability info in one pass over the source"""
+    contract_name = None
+    swc_id = None
+    hits = 0
+    for m in _METADATA_RE.finditer(solidity_code):
+        group = m.lastgroup
+        if group == "contract":
+            if contract_name is None:
+                contract_name = m.group("contract")
+        elif group == "swc":
+            if swc_id is None:
+                swc_id = m.group("swc")
+        else:
+            hits |= _KEYWORD_BIT[m.group("kw").lower()]
+            # Everything else takes its first match, and no later keyword
+            # can outrank the top-priority one (bit 0) — stop scanning
+            if contract_name and swc_id and hits & 1:
+                break
+
     info = {
         "category": "Vulnerable",
         "base_standard": "Custom",
         "vulnerability_type": "Unknown",
-        "swc_id": None,
+        "swc_id": swc_id,
         "severity": "Unknown"
     }
-    
-    # Try to extract SWC ID
-    swc_match = re.search(r'SWC-(\d+)', solidity_code)
-    if swc_match:
-        info["swc_id"] = f"SWC-{swc_match.group(1)}"
-    
-    # Try to extract vulnerability type from comments
-    if "reentrancy" in solidity_code.lower() or "Reentrancy" in solidity_code:
-        info["vulnerability_type"] = "Reentrancy"
-        info["severity"] = "High"
-    elif "access control" in solidity_code.lower() or "Access Control" in solidity_code:
-        info["vulnerability_type"] = "Access Control"
-        info["severity"] = "Critical"
-    elif "tx.origin" in solidity_code.lower():
-        info["vulnerability_type"] = "tx.origin Usage"
-        info["severity"] = "Medium"
-    elif "randomness" in solidity_code.lower() or "random" in solidity_code.lower():
-        info["vulnerability_type"] = "Weak Randomness"
-        info["severity"] = "Medium"
-    
-    # Map filename to known vulnerabilities
-    filename_lower = filename.lower()
-    if "reentrancy" in filename_lower:
-        info["vulnerability_type"] = "Reentrancy"
-        info["severity"] = "High"
-    elif "unprotected" in filename_lower or "vault" in filename_lower:
-        info["vulnerability_type"] = "Access Control"
-        info["severity"] = "Critical"
-    elif "phish" in filename_lower:
-        info["vulnerability_type"] = "tx.origin Usage"
-        info["severity"] = "Medium"
-    elif "lottery" in filename_lower or "bad" in filename_lower:
-        info["vulnerability_type"] = "Weak Randomness"
-        info["severity"] = "Medium"
-    
-    return info
+
+    if hits:
+        # Lowest set bit is the highest-priority keyword found
+        info["vulnerability_type"], info["severity"] = _VULN_KEYWORDS[(hits & -hits).bit_length() - 1][1]
+
+    # Map filename to known vulnerabilities; a filename hint overrides
+    # whatever the source scan concluded
+    name_hits = 0
+    for kw in _FILENAME_RE.findall(filename.lower()):
+        name_hits |= _FILENAME_BIT[kw]
+    if name_hits:
+        info["vulnerability_type"], info["severity"] = _VULN_KEYWORDS[(name_hits & -name_hits).bit_length() - 1][1]
+
+    return contract_name or "UnknownContract", info
 
 
 def process_vulnerable_contract(
@@ -67,38 +103,39 @@ def process_vulnerable_contract(
     max_iterations: int = 2,
     skip_auto_fix: bool = False
 ) -> Optional[Dict]:
-    print(f"\n{'='*80}")
-    print(f"Processing: {contract_path.name}")
-    print('='*80)
-    
+    log.info("\n%s\nProcessing: %s\n%s", SEP, contract_path.name, SEP)
+
     # Read contract code
     try:
-        with open(contract_path, 'r', encoding='utf-8') as f:
-            solidity_code = f.read()
+        solidity_code = contract_path.read_text(encoding='utf-8')
     except Exception as e:
-        print(f"❌ Error reading file: {e}")
+        log.error("❌ Error reading file: %s", e)
         return None
+
+    # Metadata lives in the header comments, so cap the regex/keyword
+    # scans at the first 64 KB instead of the whole source
+    scan_window = solidity_code[:65536]
+
+    # Extract contract name and vulnerability info in one scan
+    contract_name, vuln_info = extract_all_metadata(scan_window, contract_path.name)
+    log.info("Contract name: %s", contract_name)
+    log.info("Vulnerability: %s (%s)", vuln_info['vulnerability_type'], vuln_info['severity'])
     
-    # Extract contract name
-    contract_name = extract_contract_name(solidity_code)
-    print(f"Contract name: {contract_name}")
-    
-    # Extract vulnerability info
-    vuln_info = extract_vulnerability_info(solidity_code, contract_path.name)
-    print(f"Vulnerability: {vuln_info['vulnerability_type']} ({vuln_info['severity']})")
-    
-    # Create output directory
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_dir = output_base / f"{timestamp}_{contract_name}"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Create output directory (output_base is memoized after the first
+    # contract, so only the new leaf costs a mkdir)
+    output_dir = ensure_dir(output_base) / f"{run_id()}_{contract_name}"
+    output_dir.mkdir(exist_ok=True)
     
-    # Copy original contract file
+    # Archive the original contract: a hardlink shares the data blocks (no
+    # copy at all); fall back to a real copy across filesystems
     output_contract_path = output_dir / f"{contract_name}.sol"
-    with open(output_contract_path, 'w', encoding='utf-8') as f:
-        f.write(solidity_code)
+    try:
+        os.link(contract_path, output_contract_path)
+    except OSError:
+        shutil.copyfile(contract_path, output_contract_path)
     
     # Run Stage 3
-    print(f"\nRunning Stage 3...")
+    log.info("\nRunning Stage 3...")
     try:
         result = run_stage3(
             solidity_code=solidity_code,
@@ -108,10 +145,8 @@ def process_vulnerable_contract(
             tools=["slither", "mythril", "semgrep", "solhint"],
             skip_auto_fix=skip_auto_fix
         )
-    except Exception as e:
-        print(f"❌ Stage 3 failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("❌ Stage 3 failed for %s", contract_path.name)
         return None
     
     # Save final code if fixes were applied
@@ -119,7 +154,7 @@ def process_vulnerable_contract(
         final_contract_path = output_dir / f"final_{contract_name}.sol"
         with open(final_contract_path, 'w', encoding='utf-8') as f:
             f.write(result.final_code)
-        print(f"✅ Fixed code saved: {final_contract_path.name}")
+        log.info("✅ Fixed code saved: %s", final_contract_path.name)
     
     # Create metadata.json
     metadata = {
@@ -135,22 +170,20 @@ def process_vulnerable_contract(
     }
     
     metadata_path = output_dir / "metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    dump_pretty(metadata, metadata_path)
     
     # Create stage3_report.json (convert Stage3Result to dict)
     stage3_report = result.to_dict()
     
     stage3_report_path = output_dir / "stage3_report.json"
-    with open(stage3_report_path, 'w', encoding='utf-8') as f:
-        json.dump(stage3_report, f, indent=2, default=str)
+    dump_pretty(stage3_report, stage3_report_path)
     
     # Print summary
-    print(f"\n✅ Results saved to: {output_dir}")
-    print(f"  • Initial issues: {len(result.initial_analysis.issues) if result.initial_analysis else 0}")
-    print(f"  • Final issues: {len(result.final_analysis.issues) if result.final_analysis else 0}")
-    print(f"  • Issues resolved: {result.issues_resolved}")
-    print(f"  • Iterations: {result.iterations}")
+    log.info("\n✅ Results saved to: %s", output_dir)
+    log.info("  • Initial issues: %d", len(result.initial_analysis.issues) if result.initial_analysis else 0)
+    log.info("  • Final issues: %d", len(result.final_analysis.issues) if result.final_analysis else 0)
+    log.info("  • Issues resolved: %d", result.issues_resolved)
+    log.info("  • Iterations: %d", result.iterations)
     
     return {
         "contract_name": contract_name,
@@ -160,10 +193,23 @@ def process_vulnerable_contract(
     }
 
 
+def _init_worker_logging():
+    """Configure logging inside a pool worker.
+
+    Under spawn (Windows, macOS) child processes don't inherit the parent's
+    logging config, so without this the per-contract progress below INFO
+    level would be silently dropped.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
 def main():
     """Main entry point"""
     import argparse
-    
+
+    # Message-only format keeps the output identical to the old prints
+    _init_worker_logging()
+
     parser = argparse.ArgumentParser(
         description="Run Stage 3 on vulnerable contracts from vulnerable_dataset"
     )
@@ -195,6 +241,12 @@ def main():
         type=str,
         help="Process only a specific contract file (optional)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Contracts to process in parallel (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
@@ -212,37 +264,71 @@ def main():
             print(f"❌ Contract file not found: {contract_files[0]}")
             return
     else:
-        contract_files = list(input_path.glob("*.sol"))
+        # os.scandir reuses the stat info from readdir, so large datasets
+        # don't pay an extra stat per entry the way glob does
+        contract_files = [
+            Path(entry.path)
+            for entry in os.scandir(input_path)
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".sol")
+        ]
+        contract_files.sort()
     
     if not contract_files:
         print(f"⚠️  No .sol files found in {input_path}")
         return
     
-    print("="*80)
+    print(SEP)
     print("RUNNING STAGE 3 ON VULNERABLE CONTRACTS")
-    print("="*80)
+    print(SEP)
     print(f"Input directory: {input_path}")
     print(f"Output directory: {output_path}")
     print(f"Contracts found: {len(contract_files)}")
     print(f"Skip auto-fix: {args.skip_auto_fix}")
     print(f"Max iterations: {args.max_iterations}")
-    
-    # Process each contract
+    print(f"Parallel jobs: {args.jobs}")
+
+    # Each contract is independent (own output dir, own Stage 3 run
+    # dominated by external analyzer time), so process them in parallel;
+    # wall time goes from sum(contract) toward max(contract)
     results = []
-    for contract_file in contract_files:
-        result = process_vulnerable_contract(
-            contract_file,
-            output_path,
-            max_iterations=args.max_iterations,
-            skip_auto_fix=args.skip_auto_fix
-        )
-        if result:
-            results.append(result)
+    jobs = max(1, min(args.jobs, len(contract_files)))
+    if jobs == 1:
+        for contract_file in contract_files:
+            result = process_vulnerable_contract(
+                contract_file,
+                output_path,
+                max_iterations=args.max_iterations,
+                skip_auto_fix=args.skip_auto_fix
+            )
+            if result:
+                results.append(result)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker_logging
+        ) as executor:
+            futures = [
+                executor.submit(
+                    process_vulnerable_contract,
+                    contract_file,
+                    output_path,
+                    args.max_iterations,
+                    args.skip_auto_fix
+                )
+                for contract_file in contract_files
+            ]
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ Worker failed: {e}")
+                    continue
+                if result:
+                    results.append(result)
     
     # Summary
-    print("\n" + "="*80)
+    print("\n" + SEP)
     print("SUMMARY")
-    print("="*80)
+    print(SEP)
     print(f"Contracts processed: {len(results)}/{len(contract_files)}")
     
     if results:
@@ -0,0 +1,42 @@
+"""
+On-disk cache for Stage 1 intent extraction.
+
+Stage 1 is a pure function of (model, prompt), so repeat runs with the same
+input can skip the 1-3s API round-trip entirely. Entries are JSON files
+under .intent_cache/ keyed by sha256(model + prompt). Set
+INTENT_CACHE_DISABLE=1 (or pass --no-cache to run_pipeline.py) to bypass.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(".intent_cache")
+
+
+def cache_disabled() -> bool:
+    return os.getenv("INTENT_CACHE_DISABLE") == "1"
+
+
+def cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256((model + prompt).encode("utf-8")).hexdigest()
+
+
+def load_cached_spec(key: str):
+    """Return the cached spec for key, or None on miss/corruption"""
+    try:
+        with open(CACHE_DIR / f"{key}.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def store_spec(key: str, spec: dict):
+    """Best-effort write; a failed cache write never fails the pipeline"""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(CACHE_DIR / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(spec, f)
+    except OSError:
+        pass
@@ -1,8 +1,11 @@
-from openai import OpenAI
 import json
 import os
 from dotenv import load_dotenv
 
+from common.llm_client import chat_completion_cached, get_openai_client
+
+from ._cache import cache_disabled, cache_key, load_cached_spec, store_spec
+
 # Load environment variables
 load_dotenv()
 
@@ -12,7 +15,9 @@ if not API_KEY:
         "OpenAI API key not found. Set `OPENAI_API_KEY` in a .env file or in your environment."
     )
 
-client = OpenAI(api_key=API_KEY)
+client = get_openai_client(API_KEY)
+
+MODEL = "gpt-4o"
 
 # Schema prompt for intent extraction
 SCHEMA_PROMPT = """
@@ -209,11 +214,19 @@ def extract_intent(user_input: str) -> dict:
     """
     # Parse generalized input format
     formatted_input = parse_generalized_input(user_input)
-    
+
     prompt = f"{SCHEMA_PROMPT}\n\nUser input:\n{formatted_input}"
-    
-    response = client.chat.completions.create(
-        model="gpt-4o",
+
+    # Stage 1 is deterministic in (model, prompt); reuse a previous result
+    key = cache_key(MODEL, prompt)
+    if not cache_disabled():
+        cached = load_cached_spec(key)
+        if cached is not None:
+            return cached
+
+    response = chat_completion_cached(
+        client,
+        model=MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.0
     )
@@ -230,7 +243,10 @@ def extract_intent(user_input: str) -> dict:
         output_text = output_text.replace("```", "").strip()
     
     # Parse and normalize JSON
-    return _normalize_spec(json.loads(output_text), user_input)
+    spec = _normalize_spec(json.loads(output_text), user_input)
+    if not cache_disabled():
+        store_spec(key, spec)
+    return spec
 
 
 if __name__ == "__main__":
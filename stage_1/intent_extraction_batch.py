@@ -0,0 +1,112 @@
+"""
+Batch intent extraction via the OpenAI Batch API.
+
+For bulk regeneration or evaluation runs, submitting all Stage 1 prompts as
+one batch halves API cost versus individual synchronous calls and removes
+the per-request round-trip. The trade-off is latency: batches complete
+within the completion window (up to 24 hours), so this path is only worth
+it when turnaround time is flexible.
+"""
+
+import json
+import time
+
+from .intent_extraction import MODEL, SCHEMA_PROMPT, _normalize_spec, client, parse_generalized_input
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _build_request(custom_id: str, user_input: str) -> dict:
+    """Build one Batch API request line for a user input"""
+    formatted_input = parse_generalized_input(user_input)
+    prompt = f"{SCHEMA_PROMPT}\n\nUser input:\n{formatted_input}"
+
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.0,
+        },
+    }
+
+
+def _parse_output_text(output_text: str, user_input: str) -> dict:
+    """Clean markdown fences and normalize the model output (same as extract_intent)"""
+    if output_text.startswith("```json"):
+        output_text = output_text.replace("```json", "").replace("```", "").strip()
+    elif output_text.startswith("```"):
+        output_text = output_text.replace("```", "").strip()
+
+    return _normalize_spec(json.loads(output_text), user_input)
+
+
+def extract_intent_batch(
+    user_inputs: list,
+    poll_interval: int = 30,
+    completion_window: str = "24h",
+) -> list:
+    """
+    Extract structured intent for many inputs through the Batch API.
+
+    Args:
+        user_inputs: Natural language contract descriptions
+        poll_interval: Seconds between batch status polls
+        completion_window: Batch API completion window (currently only "24h")
+
+    Returns:
+        list: One spec dict per input (None for entries the batch failed on),
+              in the same order as user_inputs
+
+    Raises:
+        RuntimeError: If the batch ends in a non-completed status
+    """
+    requests = [
+        _build_request(str(i), user_input)
+        for i, user_input in enumerate(user_inputs)
+    ]
+    jsonl = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+
+    batch_input = client.files.create(
+        file=("intent_batch.jsonl", jsonl),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window=completion_window,
+    )
+
+    print(f"📤 Submitted Stage 1 batch {batch.id} ({len(user_inputs)} prompts)")
+
+    while batch.status not in TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    content = client.files.content(batch.output_file_id).text
+
+    specs = [None] * len(user_inputs)
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        index = int(entry["custom_id"])
+        response = entry.get("response") or {}
+        body = response.get("body") or {}
+        choices = body.get("choices") or []
+        if not choices:
+            continue
+        output_text = choices[0]["message"]["content"]
+        if output_text is None:
+            continue
+        try:
+            specs[index] = _parse_output_text(output_text, user_inputs[index])
+        except (json.JSONDecodeError, KeyError) as e:
+            print(f"⚠️  Batch entry {index} unparseable: {e}")
+
+    return specs
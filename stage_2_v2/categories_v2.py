@@ -4,11 +4,19 @@ Categories for Dynamic Classification System
 Simplified categories that work with LLM classification.
 """
 
+import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# slots=True drops the per-instance __dict__; these objects are created
+# once per Stage 2 call and carried through every later stage
+@dataclass(slots=True)
 class SpecCoverage:
     """Maps specification elements to implementation strategies"""
     state_variables: Dict[str, str] = field(default_factory=dict)
@@ -16,7 +24,8 @@ class SpecCoverage:
     events: Dict[str, str] = field(default_factory=dict)
     roles: Dict[str, str] = field(default_factory=dict)
     modifiers: Dict[str, str] = field(default_factory=dict)
-    
+    _summary_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self):
         return {
             "state_variables": self.state_variables,
@@ -26,21 +35,51 @@ class SpecCoverage:
             "modifiers": self.modifiers,
         }
 
+    @property
+    def summary_json(self) -> str:
+        """Pretty-printed form for prompt embedding, serialized once.
+
+        The coverage dicts are filled during mapping and only read
+        afterwards, so the first render is cached on the instance and the
+        retry loop's repeat prompt builds skip the JSON pass entirely.
+        """
+        if self._summary_json is None:
+            payload = self.to_dict()
+            if orjson is not None:
+                self._summary_json = orjson.dumps(
+                    payload, option=orjson.OPT_INDENT_2, default=str
+                ).decode("utf-8")
+            else:
+                self._summary_json = json.dumps(payload, indent=2, default=str)
+        return self._summary_json
 
-@dataclass
+
+@dataclass(slots=True)
 class ContractProfile:
     """Contract profile with template/custom distinction"""
     category: str  # "ERC20", "ERC721", "Custom", etc.
     base_standard: str  # "ERC20", "Governor", "Custom"
-    extensions: List[str]
+    extensions: FrozenSet[str]
     access_control: str  # "single_owner", "role_based", "none"
-    security_features: List[str]  # ["ReentrancyGuard", "Pausable"]
+    security_features: FrozenSet[str]  # {"ReentrancyGuard", "Pausable"}
     subtype: Optional[str] = None  # "election", "certificate", etc. (for Custom)
     is_template: bool = False  # True for ERC20, Governor, etc.
-    
+    _extensions_sorted: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _security_sorted: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozensets make the frequent membership tests in the prompt
+        # builder O(1); callers may still pass lists
+        self.extensions = frozenset(self.extensions)
+        self.security_features = frozenset(self.security_features)
+        # Profiles are immutable after construction, so sort once here
+        # instead of on every describe()/to_metadata_dict() call
+        self._extensions_sorted = tuple(sorted(self.extensions))
+        self._security_sorted = tuple(sorted(self.security_features))
+
     def describe(self):
-        ext_str = ", ".join(self.extensions) if self.extensions else "None"
-        sec_str = ", ".join(self.security_features) if self.security_features else "None"
+        ext_str = ", ".join(self._extensions_sorted) if self._extensions_sorted else "None"
+        sec_str = ", ".join(self._security_sorted) if self._security_sorted else "None"
         return (
             f"Category: {self.category}\n"
             f"Base Standard: {self.base_standard}\n"
@@ -52,7 +91,7 @@ class ContractProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of code generation"""
     solidity_code: str
@@ -69,9 +108,9 @@ class GenerationResult:
         return {
             "category": self.profile.category,
             "base_standard": self.profile.base_standard,
-            "extensions": self.profile.extensions,
+            "extensions": list(self.profile._extensions_sorted),
             "access_control": self.profile.access_control,
-            "security_features": self.profile.security_features,
+            "security_features": list(self.profile._security_sorted),
             "coverage": self.coverage.to_dict(),
             "validation_errors": self.validation_errors,
             "security_summary": self.security_summary,
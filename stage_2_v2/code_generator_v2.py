@@ -7,33 +7,149 @@ Applies fixes intelligently based on contract profile:
 - Custom contracts (elections, certificates) → Skip fixes
 """
 
+import asyncio
+import json
 import os
 import re
+from functools import lru_cache
 from typing import Tuple, List
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
+from common.llm_client import get_openai_client
 from .helpers_v2 import (
     ConstructorResolver,
-    ensure_headers,
+    looks_well_formed,
+    normalize_output,
     repair_semantic_issues,
     repair_with_model_if_needed,
-    strip_markdown_fences,
     validate_generated_code,
     validate_semantics,
 )
-from .llm_utils import call_chat_completion, estimate_tokens, truncate_spec_for_prompt
+from .llm_utils import call_chat_completion, estimate_tokens, safe_parse_json, truncate_spec_for_prompt
 
 load_dotenv()
 _API_KEY = os.getenv("OPENAI_API_KEY") or os.getenv("API_KEY")
 if not _API_KEY:
     raise RuntimeError("OpenAI API key not found in environment")
 
-_client = OpenAI(api_key=_API_KEY)
+_client = get_openai_client(_API_KEY)
+
+# Async client for batch generation, created lazily so single-contract
+# runs never pay for it
+_async_client = None
 
 # Token limits (conservative estimate)
 MAX_PROMPT_TOKENS = 120000  # ~480k chars, leaving room for response
 
+# Standard-interface functions whose redundant overrides get stripped from
+# generated code; built once at import instead of per cleanup call
+_ERC20_OVERRIDE_FUNCS = ("transfer", "approve", "transferFrom", "balanceOf", "allowance")
+_ERC721_OVERRIDE_FUNCS = ("ownerOf", "balanceOf", "transferFrom", "safeTransferFrom")
+
+
+def _get_async_client() -> AsyncOpenAI:
+    global _async_client
+    if _async_client is None:
+        try:
+            # HTTP/2 multiplexes the concurrent requests over one connection
+            import httpx
+            http_client = httpx.AsyncClient(http2=True)
+        except ImportError:
+            http_client = None  # h2 extra not installed; HTTP/1.1 keepalive still applies
+        if http_client is not None:
+            _async_client = AsyncOpenAI(api_key=_API_KEY, http_client=http_client)
+        else:
+            _async_client = AsyncOpenAI(api_key=_API_KEY)
+    return _async_client
+
+
+async def generate_solidity_code_batch(prompts: List[Tuple[str, str]]) -> List[str]:
+    """
+    Generate code for several (system_prompt, user_prompt) pairs concurrently.
+
+    The requests overlap network and model queueing time, so wall clock is
+    roughly the slowest single generation instead of the sum. Output gets the
+    same fence-stripping and header normalization as generate_solidity_code;
+    profile-aware validation/repair still runs per-contract downstream.
+    """
+    client = _get_async_client()
+
+    async def _generate(system_prompt: str, user_prompt: str) -> str:
+        # Streaming lets us abandon the response at the closing markdown
+        # fence: anything the model emits after it is prose we would strip
+        # anyway, so there is no point waiting for those tokens
+        stream = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.2,
+            timeout=120,
+            stream=True,
+        )
+        chunks: List[str] = []
+        try:
+            async for part in stream:
+                delta = part.choices[0].delta.content if part.choices else None
+                if not delta:
+                    continue
+                chunks.append(delta)
+                # Backticks are rare in Solidity, so the full-text recount
+                # only happens on the handful of fence-bearing chunks
+                if "`" in delta and "".join(chunks).count("```") >= 2:
+                    break
+        finally:
+            await stream.close()
+        return normalize_output("".join(chunks))
+
+    return list(await asyncio.gather(*(_generate(sp, up) for sp, up in prompts)))
+
+
+_REPAIR_MANY_SYSTEM = (
+    "You are a Solidity repair assistant. You receive a JSON object with a "
+    '"contracts" array of Solidity sources that failed lightweight validation. '
+    'Return a JSON object of the same shape: {"contracts": [...]} with one '
+    "repaired contract per input, in the same order. Fix only structural "
+    "problems (unbalanced braces, missing SPDX/pragma headers, stray markdown); "
+    "never change program logic."
+)
+
+
+def repair_many(codes: List[str]) -> List[str]:
+    """
+    Repair several contracts with a single model call.
+
+    Prefill dominates latency for short repair prompts, so one request
+    carrying all N candidates costs roughly one round trip instead of N.
+    Falls back to normalizing the inputs untouched if the model response
+    cannot be paired back up with them.
+    """
+    if not codes:
+        return []
+
+    try:
+        response = call_chat_completion(
+            client=_client,
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": _REPAIR_MANY_SYSTEM},
+                {"role": "user", "content": json.dumps({"contracts": codes})},
+            ],
+            temperature=0.0,
+            timeout=120,
+            max_retries=1,
+            response_format={"type": "json_object"},
+        )
+        repaired = safe_parse_json(response.choices[0].message.content or "").get("contracts")
+        if not isinstance(repaired, list) or len(repaired) != len(codes):
+            raise ValueError("model returned a mismatched contract list")
+    except Exception:
+        repaired = codes
+
+    return [normalize_output(code) for code in repaired]
+
 
 def _build_generation_spec(json_spec: dict, profile: 'ContractProfile') -> dict:
     generation_spec = dict(json_spec)
@@ -73,12 +189,18 @@ def _apply_basic_template_fixes(solidity_code: str, generation_spec: dict, profi
     return solidity_code
 
 
-def _remove_function_override(code: str, function_name: str) -> str:
-    pattern = re.compile(
+@lru_cache(maxsize=None)
+def _override_pattern(function_name: str) -> "re.Pattern[str]":
+    # The function-name vocabulary is the fixed tuples above, so each
+    # pattern compiles exactly once per process
+    return re.compile(
         rf"\n\s*function\s+{function_name}\s*\([^{{]*\{{(?:[^{{}}]*|\{{[^{{}}]*\}})*\s*\n\s*\}}",
         flags=re.DOTALL,
     )
-    return pattern.sub("\n", code)
+
+
+def _remove_function_override(code: str, function_name: str) -> str:
+    return _override_pattern(function_name).sub("\n", code)
 
 
 def _cleanup_template_code(solidity_code: str, profile: 'ContractProfile') -> str:
@@ -89,10 +211,10 @@ def _cleanup_template_code(solidity_code: str, profile: 'ContractProfile') -> st
     code = code.replace("@openzeppelin/contracts/security/Pausable.sol", "@openzeppelin/contracts/utils/Pausable.sol")
 
     if profile.category == "ERC20":
-        for function_name in ["transfer", "approve", "transferFrom", "balanceOf", "allowance"]:
+        for function_name in _ERC20_OVERRIDE_FUNCS:
             code = _remove_function_override(code, function_name)
     elif profile.category == "ERC721":
-        for function_name in ["ownerOf", "balanceOf", "transferFrom", "safeTransferFrom"]:
+        for function_name in _ERC721_OVERRIDE_FUNCS:
             code = _remove_function_override(code, function_name)
 
     # Normalize excessive blank lines left after cleanup.
@@ -176,13 +298,18 @@ def generate_solidity_code(
         raise RuntimeError(f"Failed to generate code: {e}")
     
     solidity_code = response.choices[0].message.content or ""
-    
+
     if debug:
         print(f"[1] Generated {len(solidity_code)} characters")
+        # Confirm the static system prompt is hitting server-side prompt caching
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is not None:
+            print(f"[1] Prompt cache: {cached_tokens}/{usage.prompt_tokens} input tokens served from cache")
     
     # Clean up markdown fences and ensure headers
-    solidity_code = strip_markdown_fences(solidity_code)
-    solidity_code = ensure_headers(solidity_code)
+    solidity_code = normalize_output(solidity_code)
     solidity_code = _apply_basic_template_fixes(solidity_code, generation_spec, profile, debug=debug)
     
     # Initialize fixes tracking
@@ -341,10 +468,16 @@ def generate_solidity_code(
                     print(f"[{attempt + 2}] ✅ Constructor resolver fixed the issues!")
                 continue
             
-            # If still issues, use model repair
+            # If still issues, use model repair — unless the code is already
+            # structurally sound, in which case the round trip is wasted
+            if looks_well_formed(solidity_code):
+                if debug:
+                    print(f"[{attempt + 2}] Code structurally sound — skipping model repair")
+                continue
+
             if debug:
                 print(f"[{attempt + 2}] Using model repair for remaining syntax issues...")
-            
+
             code_before = solidity_code
             solidity_code = repair_with_model_if_needed(_client, solidity_code)
             
@@ -14,9 +14,80 @@ Handles all generalized input types:
 - DAO/Governance (token-based voting, automatic execution)
 """
 
+import hashlib
+import json
+from collections import OrderedDict
 from typing import Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .categories_v2 import SpecCoverage, ContractProfile
 
+# Mapping is pure in (spec, category/subtype), so repeat runs over the
+# same spec replay a cached result instead of re-walking every element
+_COVERAGE_CACHE: "OrderedDict[bytes, SpecCoverage]" = OrderedDict()
+_COVERAGE_CACHE_MAX = 256
+
+
+def _coverage_key(json_spec: Dict, profile: ContractProfile) -> bytes:
+    payload = {
+        "s": json_spec,
+        # Only the fields the mappers dispatch on
+        "c": profile.category,
+        "y": profile.subtype,
+        "t": profile.is_template,
+    }
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _copy_coverage(coverage: SpecCoverage) -> SpecCoverage:
+    # Shallow dict copies keep cached entries safe from caller mutation;
+    # the values are plain strings, so this is far cheaper than remapping
+    return SpecCoverage(
+        state_variables=dict(coverage.state_variables),
+        functions=dict(coverage.functions),
+        events=dict(coverage.events),
+        roles=dict(coverage.roles),
+        modifiers=dict(coverage.modifiers),
+    )
+
+# Standard-interface member names, hoisted so membership tests reuse one
+# frozenset per call instead of rebuilding a set literal per element
+_ERC20_CONSTRUCTOR_VARS = frozenset({"name", "symbol"})
+_ERC20_INHERITED_FUNCS = frozenset({"transfer", "transferFrom", "approve", "balanceOf", "allowance"})
+_ERC721_INHERITED_FUNCS = frozenset({"ownerOf", "balanceOf", "safeTransferFrom", "transferFrom"})
+_GOVERNOR_INHERITED_FUNCS = frozenset({"propose", "castvote", "execute", "queue"})
+
+# Keyword→note rule tables for the simpler mappers: one ordered pass per
+# function name instead of a branch-heavy if/elif block. First rule whose
+# keyword appears in the (lowercased) name wins, preserving chain order.
+_STAKING_RULES = (
+    (("stake",), "Stake with SafeERC20 + ReentrancyGuard"),
+    (("unstake", "withdraw"), "Unstake + reward claim"),
+    (("claim",), "Claim accumulated rewards"),
+)
+
+_MARKETPLACE_RULES = (
+    (("list",), "Create listing with price and token"),
+    (("buy",), "Purchase with payment handling"),
+    (("cancel",), "Cancel listing"),
+)
+
+
+def _classify(lower_name: str, rules, default: str) -> str:
+    """Return the note of the first rule matching lower_name"""
+    for keywords, note in rules:
+        if any(kw in lower_name for kw in keywords):
+            return note
+    return default
+
 
 class CoverageMapper:
     """Maps JSON spec to implementation coverage"""
@@ -29,59 +100,36 @@ class CoverageMapper:
         For templates: Map to OpenZeppelin patterns
         For custom: Map to custom implementation strategies
         """
+        key = _coverage_key(json_spec, profile)
+        cached = _COVERAGE_CACHE.get(key)
+        if cached is not None:
+            _COVERAGE_CACHE.move_to_end(key)
+            return _copy_coverage(cached)
+
         coverage = SpecCoverage()
-        
+
         if profile.is_template:
             CoverageMapper._map_template(json_spec, profile, coverage)
         else:
             CoverageMapper._map_custom(json_spec, profile, coverage)
-        
+
+        _COVERAGE_CACHE[key] = _copy_coverage(coverage)
+        if len(_COVERAGE_CACHE) > _COVERAGE_CACHE_MAX:
+            _COVERAGE_CACHE.popitem(last=False)
         return coverage
     
     @staticmethod
     def _map_template(json_spec: Dict, profile: ContractProfile, coverage: SpecCoverage):
         """Map template contracts (ERC20, Governor, etc.)"""
-        
-        category = profile.category
-        
-        if category == "ERC20":
-            CoverageMapper._map_erc20(json_spec, profile, coverage)
-        elif category == "ERC721":
-            CoverageMapper._map_erc721(json_spec, profile, coverage)
-        elif category == "Governor":
-            CoverageMapper._map_governor(json_spec, profile, coverage)
-        elif category == "Staking":
-            CoverageMapper._map_staking(json_spec, profile, coverage)
-        elif category == "Vault":
-            CoverageMapper._map_vault(json_spec, profile, coverage)
-        elif category == "Marketplace":
-            CoverageMapper._map_marketplace(json_spec, profile, coverage)
-        else:
-            # Fallback to generic template mapping
-            CoverageMapper._map_generic_template(json_spec, profile, coverage)
-    
+        mapper = _TEMPLATE_MAPPERS.get(profile.category, CoverageMapper._map_generic_template)
+        mapper(json_spec, profile, coverage)
+
     @staticmethod
     def _map_custom(json_spec: Dict, profile: ContractProfile, coverage: SpecCoverage):
         """Map custom contracts with semantic understanding"""
-        
         subtype = profile.subtype or "general"
-        
-        # Map based on subtype
-        if subtype == "election":
-            CoverageMapper._map_election(json_spec, coverage)
-        elif subtype == "certificate":
-            CoverageMapper._map_certificate(json_spec, coverage)
-        elif subtype == "supply_chain":
-            CoverageMapper._map_supply_chain(json_spec, coverage)
-        elif subtype == "royalty":
-            CoverageMapper._map_royalty(json_spec, coverage)
-        elif subtype == "authentication":
-            CoverageMapper._map_authentication(json_spec, coverage)
-        elif subtype == "registry":
-            CoverageMapper._map_registry(json_spec, coverage)
-        else:
-            # Generic custom mapping
-            CoverageMapper._map_generic_custom(json_spec, coverage)
+        mapper = _CUSTOM_MAPPERS.get(subtype, CoverageMapper._map_generic_custom)
+        mapper(json_spec, coverage)
     
     # Template mappers
     
@@ -90,7 +138,7 @@ class CoverageMapper:
         """Map ERC20 token specification"""
         for var in json_spec.get("state_variables", []):
             name = var.get("name", "")
-            if name in {"name", "symbol"}:
+            if name in _ERC20_CONSTRUCTOR_VARS:
                 coverage.state_variables[name] = "Implemented via ERC20 constructor"
             elif name == "totalSupply":
                 coverage.state_variables[name] = "Dynamic via ERC20.totalSupply()"
@@ -99,7 +147,7 @@ class CoverageMapper:
         
         for func in json_spec.get("functions", []):
             fname = func.get("name", "")
-            if fname in {"transfer", "transferFrom", "approve", "balanceOf", "allowance"}:
+            if fname in _ERC20_INHERITED_FUNCS:
                 coverage.functions[fname] = "Inherited from ERC20"
             elif fname == "mint":
                 coverage.functions[fname] = "Custom mint() with access control"
@@ -116,7 +164,7 @@ class CoverageMapper:
         """Map ERC721 NFT specification"""
         for func in json_spec.get("functions", []):
             fname = func.get("name", "")
-            if fname in {"ownerOf", "balanceOf", "safeTransferFrom", "transferFrom"}:
+            if fname in _ERC721_INHERITED_FUNCS:
                 coverage.functions[fname] = "Inherited from ERC721"
             elif fname == "mint":
                 coverage.functions[fname] = "Custom safeMint() implementation"
@@ -135,7 +183,7 @@ class CoverageMapper:
         
         for func in json_spec.get("functions", []):
             fname = func.get("name", "").lower()
-            if fname in {"propose", "castvote", "execute", "queue"}:
+            if fname in _GOVERNOR_INHERITED_FUNCS:
                 coverage.functions[func.get("name")] = "Inherited from Governor - Use inherited functions"
             elif "vote" in fname:
                 coverage.functions[func.get("name")] = "Vote casting - MUST: 1) Use getVotes(msg.sender, proposalSnapshot(proposalId)) for token balance (not parameter), 2) Use per-proposal hasVoted mapping, 3) Check BOTH majority AND quorum, 4) Auto-execute if conditions met"
@@ -157,14 +205,7 @@ class CoverageMapper:
         """Map staking contract specification"""
         for func in json_spec.get("functions", []):
             fname = func.get("name", "").lower()
-            if "stake" in fname:
-                coverage.functions[fname] = "Stake with SafeERC20 + ReentrancyGuard"
-            elif "unstake" in fname or "withdraw" in fname:
-                coverage.functions[fname] = "Unstake + reward claim"
-            elif "claim" in fname:
-                coverage.functions[fname] = "Claim accumulated rewards"
-            else:
-                coverage.functions[fname] = "Custom staking function"
+            coverage.functions[fname] = _classify(fname, _STAKING_RULES, "Custom staking function")
     
     @staticmethod
     def _map_vault(json_spec: Dict, profile: ContractProfile, coverage: SpecCoverage):
@@ -178,14 +219,7 @@ class CoverageMapper:
         """Map marketplace specification"""
         for func in json_spec.get("functions", []):
             fname = func.get("name", "").lower()
-            if "list" in fname:
-                coverage.functions[fname] = "Create listing with price and token"
-            elif "buy" in fname:
-                coverage.functions[fname] = "Purchase with payment handling"
-            elif "cancel" in fname:
-                coverage.functions[fname] = "Cancel listing"
-            else:
-                coverage.functions[fname] = "Marketplace function"
+            coverage.functions[fname] = _classify(fname, _MARKETPLACE_RULES, "Marketplace function")
     
     @staticmethod
     def _map_generic_template(json_spec: Dict, profile: ContractProfile, coverage: SpecCoverage):
@@ -356,3 +390,24 @@ class CoverageMapper:
             coverage.events[event.get("name", "")] = "Custom event"
         for role in json_spec.get("roles", []):
             coverage.roles[role.get("name", "")] = "Custom role"
+
+
+# Dispatch tables: O(1) category/subtype lookup instead of the if/elif
+# chains, and new mappers only need a table entry
+_TEMPLATE_MAPPERS = {
+    "ERC20": CoverageMapper._map_erc20,
+    "ERC721": CoverageMapper._map_erc721,
+    "Governor": CoverageMapper._map_governor,
+    "Staking": CoverageMapper._map_staking,
+    "Vault": CoverageMapper._map_vault,
+    "Marketplace": CoverageMapper._map_marketplace,
+}
+
+_CUSTOM_MAPPERS = {
+    "election": CoverageMapper._map_election,
+    "certificate": CoverageMapper._map_certificate,
+    "supply_chain": CoverageMapper._map_supply_chain,
+    "royalty": CoverageMapper._map_royalty,
+    "authentication": CoverageMapper._map_authentication,
+    "registry": CoverageMapper._map_registry,
+}
@@ -11,7 +11,15 @@ Flow:
 4. Apply fixes only where appropriate
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from .categories_v2 import GenerationResult, SpecCoverage, ContractProfile
 from .llm_classifier import classify_contract
 from .profile_selector_v2 import select_profile_dynamic
@@ -19,23 +27,74 @@ from .coverage_mapper_v2 import CoverageMapper
 from .updated_prompt_builder_v2 import build_prompts_dynamic
 from .code_generator_v2 import generate_solidity_code
 
+# Progress output goes through logging with %s placeholders: formatting is
+# deferred until a handler actually wants the record, and callers can
+# silence or redirect Stage 2 without touching stdout
+log = logging.getLogger(__name__)
+
+SEP = "=" * 80
+
+# Validation is independent of classification, so it runs on this worker
+# while the classification LLM call is in flight
+_VALIDATION_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spec-validate")
+
 
 class SpecValidator:
     """Validates JSON specification"""
-    
+
     REQUIRED_FIELDS = ["contract_name"]
     VALID_VISIBILITIES = {"public", "private", "internal", "external"}
-    
+
+    # Same rules as the hand-rolled checks below, expressed as a schema so
+    # fastjsonschema can compile them to straight-line code once at import
+    _SCHEMA = {
+        "type": "object",
+        "required": ["contract_name"],
+        "properties": {
+            "contract_name": {"minLength": 1},
+            "state_variables": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "visibility": {"enum": sorted(VALID_VISIBILITIES)},
+                    },
+                },
+            },
+            "functions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "visibility": {"enum": sorted(VALID_VISIBILITIES)},
+                    },
+                },
+            },
+        },
+    }
+
     @staticmethod
     def validate(json_spec: Dict) -> List[str]:
         """Validate specification and return errors"""
+        if _COMPILED_VALIDATOR is not None:
+            errors = []
+            try:
+                _COMPILED_VALIDATOR(json_spec)
+            except fastjsonschema.JsonSchemaValueException as e:
+                # Compiled validation short-circuits on the first failure
+                errors.append(f"{e.message} (at {'.'.join(str(p) for p in e.path)})")
+            SpecValidator._check_restricted_roles(json_spec, errors)
+            return errors
+
         errors = []
-        
+
         # Check required fields
         for field in SpecValidator.REQUIRED_FIELDS:
             if field not in json_spec or not json_spec[field]:
                 errors.append(f"Missing required field: '{field}'")
-        
+
         # Validate state variables
         for var in json_spec.get("state_variables", []):
             if "name" not in var:
@@ -43,7 +102,7 @@ class SpecValidator:
             vis = var.get("visibility")
             if vis and vis not in SpecValidator.VALID_VISIBILITIES:
                 errors.append(f"Invalid visibility '{vis}' for variable '{var.get('name')}'")
-        
+
         # Validate functions
         for func in json_spec.get("functions", []):
             if "name" not in func:
@@ -51,9 +110,32 @@ class SpecValidator:
             vis = func.get("visibility")
             if vis and vis not in SpecValidator.VALID_VISIBILITIES:
                 errors.append(f"Invalid visibility for function '{func.get('name')}'")
-        
+
+        SpecValidator._check_restricted_roles(json_spec, errors)
         return errors
 
+    @staticmethod
+    def _check_restricted_roles(json_spec: Dict, errors: List[str]) -> None:
+        """Cross-field check: restricted_to must name a declared role.
+
+        The role set is built once, so the check is O(functions + roles)
+        rather than rescanning the role list per function.
+        """
+        role_names = frozenset(
+            r.get("name") for r in json_spec.get("roles", ()) if r.get("name")
+        ) | {"owner"}
+        for func in json_spec.get("functions", []):
+            restricted_to = func.get("restricted_to")
+            if restricted_to and restricted_to not in role_names:
+                errors.append(
+                    f"Function '{func.get('name')}' restricted to undeclared role '{restricted_to}'"
+                )
+
+
+_COMPILED_VALIDATOR = (
+    fastjsonschema.compile(SpecValidator._SCHEMA) if fastjsonschema is not None else None
+)
+
 
 def generate_solidity_v2(
     user_input: str,
@@ -73,63 +155,63 @@ def generate_solidity_v2(
     """
     
     if debug:
-        print("\n" + "="*80)
-        print("STAGE 2: DYNAMIC SOLIDITY GENERATION")
-        print("="*80)
-    
-    # Step 1: Validate specification
-    validation_errors = SpecValidator.validate(json_spec)
-    if validation_errors:
-        if debug:
-            print(f"\nValidation warnings: {len(validation_errors)}")
-            for err in validation_errors[:5]:
-                print(f"  - {err}")
-    else:
-        if debug:
-            print("\nSpecification validation: OK")
-    
+        log.info("\n%s\nSTAGE 2: DYNAMIC SOLIDITY GENERATION\n%s", SEP, SEP)
+
+    # Step 1: Validate specification — overlapped with classification,
+    # since neither consumes the other's output
+    validation_future = _VALIDATION_POOL.submit(SpecValidator.validate, json_spec)
+
     # Step 2: LLM Classification + Profile Selection
     if debug:
-        print("\n[Step 1/4] LLM Classification & Profile Selection...")
-    
+        log.info("\n[Step 1/4] LLM Classification & Profile Selection...")
+
     result = select_profile_dynamic(user_input, json_spec, debug=debug)
     classification = result['classification']
     profile = result['profile']
-    
+
+    validation_errors = validation_future.result()
     if debug:
-        print(f"\nClassified as: {classification['contract_type']}")
-        print(f"Confidence: {classification['confidence']:.0%}")
-        print(f"Is Template: {profile.is_template}")
-        print(f"Approach: {classification['recommended_approach']}")
+        if validation_errors:
+            log.info("\nValidation warnings: %d", len(validation_errors))
+            for err in validation_errors[:5]:
+                log.info("  - %s", err)
+        else:
+            log.info("\nSpecification validation: OK")
+
+    if debug:
+        log.info("\nClassified as: %s", classification['contract_type'])
+        log.info("Confidence: %.0f%%", classification['confidence'] * 100)
+        log.info("Is Template: %s", profile.is_template)
+        log.info("Approach: %s", classification['recommended_approach'])
         if classification.get('reasoning'):
-            print(f"Reasoning: {classification['reasoning']}")
-    
+            log.info("Reasoning: %s", classification['reasoning'])
+
     # Step 3: Coverage Mapping
     if debug:
-        print("\n[Step 2/4] Coverage Mapping...")
-    
+        log.info("\n[Step 2/4] Coverage Mapping...")
+
     coverage = CoverageMapper.map_specification(json_spec, profile)
-    
+
     if debug:
-        print(f"Mapped {len(coverage.functions)} functions")
-        print(f"Mapped {len(coverage.state_variables)} state variables")
-    
+        log.info("Mapped %d functions", len(coverage.functions))
+        log.info("Mapped %d state variables", len(coverage.state_variables))
+
     # Step 4: Build Prompts
     if debug:
-        print("\n[Step 3/4] Building Prompts...")
-    
+        log.info("\n[Step 3/4] Building Prompts...")
+
     system_prompt, user_prompt, imports_used, inheritance_chain = build_prompts_dynamic(
         json_spec, profile, classification, coverage, debug=debug
     )
-    
+
     if debug:
-        print(f"Prompt type: {'Template' if profile.is_template else 'Custom'}")
-        print(f"Imports: {len(imports_used)}")
-        print(f"Inheritance: {', '.join(inheritance_chain) if inheritance_chain else 'None'}")
-    
+        log.info("Prompt type: %s", 'Template' if profile.is_template else 'Custom')
+        log.info("Imports: %d", len(imports_used))
+        log.info("Inheritance: %s", ', '.join(inheritance_chain) if inheritance_chain else 'None')
+
     # Step 5: Generate Code
     if debug:
-        print("\n[Step 4/4] Generating Solidity Code...")
+        log.info("\n[Step 4/4] Generating Solidity Code...")
     
     solidity_code, fixes_applied = generate_solidity_code(
         system_prompt=system_prompt,
@@ -156,15 +238,13 @@ def generate_solidity_v2(
     )
     
     if debug:
-        print("\n" + "="*80)
-        print("GENERATION COMPLETE")
-        print("="*80)
-        print(f"Contract Type: {classification['contract_type']}")
-        print(f"Category: {profile.category}")
-        print(f"Subtype: {profile.subtype or 'N/A'}")
-        print(f"Lines of Code: {len(solidity_code.splitlines())}")
-        print(f"Classification Confidence: {classification['confidence']:.0%}")
-        print("="*80 + "\n")
+        log.info("\n%s\nGENERATION COMPLETE\n%s", SEP, SEP)
+        log.info("Contract Type: %s", classification['contract_type'])
+        log.info("Category: %s", profile.category)
+        log.info("Subtype: %s", profile.subtype or 'N/A')
+        log.info("Lines of Code: %d", solidity_code.count('\n') + 1)
+        log.info("Classification Confidence: %.0f%%", classification['confidence'] * 100)
+        log.info("%s\n", SEP)
     
     return result
 
@@ -179,7 +259,7 @@ def _build_security_summary(profile: ContractProfile, classification: Dict) -> s
     ]
     
     if profile.security_features:
-        lines.append(f"Security Features: {', '.join(profile.security_features)}")
+        lines.append(f"Security Features: {', '.join(profile._security_sorted)}")
     else:
         lines.append("Security Features: Standard")
     
@@ -1,16 +1,15 @@
 import re
 from typing import Dict, List, Tuple
 
+# Optional leading/trailing fence plus surrounding whitespace in one match;
+# the lazy middle group comes out already trimmed, so no intermediate
+# stripped copies of the (potentially large) source are allocated
+_FENCE_RE = re.compile(r"\A\s*(?:```(?:solidity)?)?\s*(.*?)\s*(?:```)?\s*\Z", re.DOTALL)
+
 
 def strip_markdown_fences(text: str) -> str:
-    text = (text or "").strip()
-    if text.startswith("```solidity"):
-        text = text[len("```solidity"):].strip()
-    elif text.startswith("```"):
-        text = text[3:].strip()
-    if text.endswith("```"):
-        text = text[:-3].strip()
-    return text
+    m = _FENCE_RE.match(text or "")
+    return m.group(1) if m else (text or "").strip()
 
 
 def ensure_headers(code: str) -> str:
@@ -25,6 +24,65 @@ def ensure_headers(code: str) -> str:
     return code
 
 
+def normalize_output(code: str) -> str:
+    """Strip markdown fences and guarantee SPDX/pragma headers in one step.
+
+    ensure_headers rebuilt the whole source through splitlines/join just to
+    slot the pragma in; here header insertion is a single slice-and-concat,
+    so model output is normalized with one fence match, two substring scans
+    and at most one copy.
+    """
+    code = strip_markdown_fences(code)
+    has_spdx = "SPDX-License-Identifier" in code
+    has_pragma = "pragma solidity" in code
+    if has_spdx and has_pragma:
+        return code
+
+    if not has_spdx:
+        prefix = "// SPDX-License-Identifier: MIT\n"
+        if not has_pragma:
+            prefix += "pragma solidity ^0.8.20;\n"
+        return prefix + code
+
+    # SPDX present but pragma missing: insert right below the SPDX line
+    # when it leads the file, otherwise at the top
+    end = code.find("\n")
+    first_line = code if end == -1 else code[:end]
+    if "SPDX-License-Identifier" not in first_line:
+        return "pragma solidity ^0.8.20;\n" + code
+    if end == -1:
+        return code + "\npragma solidity ^0.8.20;"
+    return code[:end + 1] + "pragma solidity ^0.8.20;\n" + code[end + 1:]
+
+
+# A contract/library/interface declaration somewhere in the source
+_DECLARATION_RE = re.compile(r"\b(?:contract|library|interface)\s+\w+")
+
+
+def looks_well_formed(code: str) -> bool:
+    """Cheap syntactic screen: required headers, no leftover markdown
+    fences, a top-level declaration, and balanced braces.
+
+    Used to skip the model repair round trip when the generated code is
+    already structurally sound — a few linear scans instead of an API call.
+    """
+    if "pragma solidity" not in code or "SPDX-License-Identifier" not in code:
+        return False
+    if "```" in code:
+        return False
+    if _DECLARATION_RE.search(code) is None:
+        return False
+    depth = 0
+    for ch in code:
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
 def repair_with_model_if_needed(_client, code: str) -> str:
     return code
 
@@ -8,11 +8,12 @@ classify what type of smart contract the user wants to build.
 This scales to ANY domain without manual category engineering.
 """
 
+import asyncio
 import os
 import json
-from typing import Dict, Optional, Tuple
-from openai import OpenAI
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+from common.llm_client import get_openai_client
 from .llm_utils import safe_parse_json, call_chat_completion, validate_classification_schema
 
 load_dotenv()
@@ -20,7 +21,7 @@ API_KEY = os.getenv("OPENAI_API_KEY") or os.getenv("API_KEY")
 if not API_KEY:
     raise RuntimeError("OpenAI API key not found")
 
-client = OpenAI(api_key=API_KEY)
+client = get_openai_client(API_KEY)
 
 # Known template types where we have optimized patterns
 TEMPLATE_TYPES = {
@@ -253,22 +254,72 @@ class ContractClassifier:
         return result
 
 
+# Lowercased lookup for the explicit contract_type fast path
+_TEMPLATE_TYPES_LOWER = {name.lower(): name for name in TEMPLATE_TYPES}
+
+# The fast-path result for a given template type never varies, so build
+# one dict per type at import and hand out the shared instance; callers
+# treat classifications as read-only
+_FAST_CLASSIFICATIONS = {
+    name: {
+        "contract_type": name,
+        "subtype": None,
+        "confidence": 0.95,
+        "reasoning": f"contract_type '{name}' declared explicitly in the specification",
+        "is_template": True,
+        "recommended_approach": "template",
+    }
+    for name in TEMPLATE_TYPES
+}
+
+
 def classify_contract(user_input: str, json_spec: Optional[Dict] = None, debug: bool = False) -> Dict:
     """
     Convenience function for contract classification.
-    
+
     Args:
         user_input: Original user input
         json_spec: Optional JSON spec from Stage 1
         debug: Enable debug output
-    
+
     Returns:
         Classification dict with type, confidence, reasoning
     """
+    # Fast path: when Stage 1 already names a template type exactly
+    # (e.g. contract_type == "ERC20"), the LLM round trip adds nothing
+    if json_spec:
+        explicit = _TEMPLATE_TYPES_LOWER.get(str(json_spec.get("contract_type", "")).strip().lower())
+        if explicit:
+            if debug:
+                print(f"Classification fast path: spec declares contract_type '{explicit}'")
+            return _FAST_CLASSIFICATIONS[explicit]
+
     classifier = ContractClassifier(debug=debug)
     return classifier.classify(user_input, json_spec)
 
 
+async def classify_contracts_batch(
+    items: List[Tuple[str, Optional[Dict]]],
+    max_concurrency: int = 4,
+    debug: bool = False
+) -> List[Dict]:
+    """
+    Classify several (user_input, json_spec) pairs concurrently.
+
+    Each classification is either the template fast path (no I/O) or an
+    LLM round trip; running them on worker threads with a concurrency cap
+    makes corpus-scale runs cost roughly the slowest call per batch
+    instead of the sum.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _classify_one(user_input: str, json_spec: Optional[Dict]) -> Dict:
+        async with semaphore:
+            return await asyncio.to_thread(classify_contract, user_input, json_spec, debug)
+
+    return list(await asyncio.gather(*(_classify_one(u, s) for u, s in items)))
+
+
 # Quick test
 if __name__ == "__main__":
     test_inputs = [
@@ -8,6 +8,8 @@ from typing import Dict, Optional, Any
 from openai import OpenAI
 import time
 
+from common.llm_client import chat_completion_cached
+
 
 def safe_parse_json(text: str, debug: bool = False) -> Dict:
     """
@@ -75,7 +77,10 @@ def call_chat_completion(
 ) -> Any:
     """
     Resilient wrapper for OpenAI chat completion with timeout and retry logic.
-    
+
+    Identical (model, messages, params) requests are served from the shared
+    response cache (see common.llm_client) instead of hitting the API again.
+
     Args:
         client: OpenAI client instance
         model: Model name (e.g., "gpt-4o")
@@ -98,7 +103,8 @@ def call_chat_completion(
             # Try with response_format if provided
             if 'response_format' in kwargs:
                 try:
-                    response = client.chat.completions.create(
+                    response = chat_completion_cached(
+                        client,
                         model=model,
                         messages=messages,
                         timeout=timeout,
@@ -110,7 +116,8 @@ def call_chat_completion(
                     if debug:
                         print(f"Warning: response_format not supported, retrying without it")
                     kwargs_no_format = {k: v for k, v in kwargs.items() if k != 'response_format'}
-                    response = client.chat.completions.create(
+                    response = chat_completion_cached(
+                        client,
                         model=model,
                         messages=messages,
                         timeout=timeout,
@@ -118,7 +125,8 @@ def call_chat_completion(
                     )
                     return response
             else:
-                response = client.chat.completions.create(
+                response = chat_completion_cached(
+                    client,
                     model=model,
                     messages=messages,
                     timeout=timeout,
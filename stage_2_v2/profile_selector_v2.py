@@ -6,10 +6,42 @@ Uses LLM to classify contracts and build appropriate profiles
 instead of hardcoded keyword matching.
 """
 
+import hashlib
+import json
+import re
+from collections import OrderedDict
 from typing import Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .categories_v2 import ContractProfile
 from .llm_classifier import classify_contract
 
+# Pipeline retries and A/B prompt runs re-select the profile for the same
+# spec; a small LRU keyed by a canonical hash makes repeats O(1)
+_PROFILE_CACHE: "OrderedDict[bytes, Dict]" = OrderedDict()
+_PROFILE_CACHE_MAX = 256
+
+# One compiled alternation scan over the description instead of a fresh
+# substring pass per keyword
+_PAYMENT_WORDS_RE = re.compile(r"payment|transfer|withdraw|distribute|royalty")
+
+# Custom subtypes that always get ReentrancyGuard; module constant so the
+# membership test doesn't rebuild a list per call
+_REENTRANCY_SUBTYPES = frozenset({"election", "supply_chain", "royalty"})
+
+
+def _spec_key(user_input: str, json_spec: Dict) -> bytes:
+    payload = {"u": user_input, "s": json_spec}
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 
 def select_profile_dynamic(user_input: str, json_spec: Dict, debug: bool = False) -> Dict:
     """
@@ -24,16 +56,28 @@ def select_profile_dynamic(user_input: str, json_spec: Dict, debug: bool = False
         Dict with 'classification' and 'profile' keys
     """
     
+    key = _spec_key(user_input, json_spec)
+    cached = _PROFILE_CACHE.get(key)
+    if cached is not None:
+        _PROFILE_CACHE.move_to_end(key)
+        return cached
+
     # Step 1: LLM Classification
     classification = classify_contract(user_input, json_spec, debug=debug)
-    
+
     # Step 2: Build profile based on classification
     profile = _build_profile_from_classification(classification, json_spec)
-    
-    return {
+
+    result = {
         'classification': classification,
         'profile': profile
     }
+    # ContractProfile freezes its collections in __post_init__, so the
+    # cached entry is safe to hand out repeatedly
+    _PROFILE_CACHE[key] = result
+    if len(_PROFILE_CACHE) > _PROFILE_CACHE_MAX:
+        _PROFILE_CACHE.popitem(last=False)
+    return result
 
 
 def _build_profile_from_classification(classification: Dict, json_spec: Dict) -> ContractProfile:
@@ -43,62 +87,68 @@ def _build_profile_from_classification(classification: Dict, json_spec: Dict) ->
     is_template = classification.get('is_template', False)
     subtype = classification.get('subtype')
     
+    # One pass over the function list populates every derived view the
+    # branches below need, instead of re-walking it per check
+    functions = json_spec.get('functions', [])
+    func_names = set()
+    has_payable = False
+    has_restricted = False
+    for f in functions:
+        func_names.add(f.get('name', '').lower())
+        if f.get('payable', False):
+            has_payable = True
+        if f.get('restricted_to'):
+            has_restricted = True
+
     # Determine access control
     roles = json_spec.get('roles', [])
     if len(roles) > 1:
         access_control = "role_based"
-    elif len(roles) == 1 or any(f.get('restricted_to') for f in json_spec.get('functions', [])):
+    elif len(roles) == 1 or has_restricted:
         access_control = "role_based"
     else:
         access_control = "single_owner"
-    
+
     # Determine security features
     security_features = []
-    functions = json_spec.get('functions', [])
-    
+
     # Check for payable functions (need ReentrancyGuard)
-    if any(f.get('payable', False) for f in functions):
+    if has_payable:
         security_features.append("ReentrancyGuard")
     
-    # For custom contracts, add ReentrancyGuard if handling payments
+    # For custom contracts, add ReentrancyGuard if handling payments or for
+    # subtypes that always need it; ContractProfile freezes the list into a
+    # frozenset, so duplicate appends dedup there and the per-append
+    # membership scans are unnecessary
     if not is_template:
         description = json_spec.get('description', '').lower()
-        if any(word in description for word in ['payment', 'transfer', 'withdraw', 'distribute', 'royalty']):
-            if "ReentrancyGuard" not in security_features:
-                security_features.append("ReentrancyGuard")
-        
-        # For elections and supply chain, add ReentrancyGuard
-        if subtype in ['election', 'supply_chain', 'royalty']:
-            if "ReentrancyGuard" not in security_features:
-                security_features.append("ReentrancyGuard")
+        if _PAYMENT_WORDS_RE.search(description):
+            security_features.append("ReentrancyGuard")
+
+        if subtype in _REENTRANCY_SUBTYPES:
+            security_features.append("ReentrancyGuard")
     
     # Build extensions for template contracts
     extensions = []
     if is_template and contract_type == "ERC20":
-        func_names = {f.get('name', '').lower() for f in functions}
         if 'burn' in func_names:
             extensions.append("Burnable")
-        if any('cap' in v.get('name', '').lower() or 'max' in v.get('name', '').lower() 
-               for v in json_spec.get('state_variables', [])):
+        if any('cap' in name or 'max' in name
+               for name in (v.get('name', '').lower() for v in json_spec.get('state_variables', []))):
             extensions.append("Capped")
         if 'pause' in func_names or 'unpause' in func_names:
             extensions.append("Pausable")
             security_features.append("Pausable")
     
-    # Determine base standard
+    # Determine base standard: the template standard is the contract type
+    # itself, refined only for ERC20 extension variants
     if is_template:
+        base_standard = contract_type
         if contract_type == "ERC20":
-            base_standard = "ERC20"
             if "Capped" in extensions:
                 base_standard = "ERC20Capped"
             elif "Burnable" in extensions:
                 base_standard = "ERC20Burnable"
-        elif contract_type == "ERC721":
-            base_standard = "ERC721"
-        elif contract_type == "Governor":
-            base_standard = "Governor"
-        else:
-            base_standard = contract_type
     else:
         base_standard = "Custom"
     
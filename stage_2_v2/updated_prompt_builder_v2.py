@@ -8,10 +8,32 @@ Instead of hardcoded category rules, prompts are built based on:
 3. The business logic from the specification
 """
 
+import hashlib
 import json
-from typing import Dict, List, Tuple
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .llm_utils import estimate_tokens, truncate_spec_for_prompt
 
+
+def _dumps_spec(obj) -> str:
+    """Pretty-print a spec/coverage dict for prompt embedding.
+
+    orjson's C serializer is several times faster than the pure-Python
+    indent path for the multi-KB specs these prompts embed; key order is
+    preserved either way, so the prompt text is unchanged.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return json.dumps(obj, indent=2, default=str)
+
 # Template-specific guidance
 TEMPLATE_GUIDANCE = {
     "ERC20": """
@@ -238,101 +260,18 @@ function vote(uint256 proposalId, uint256 voteWeight) external {{
 }}
 """
 
+# The rule blocks above are far past the compiler's automatic interning
+# threshold; interning them explicitly guarantees a single shared copy per
+# process and makes any equality check against them a pointer comparison
+TEMPLATE_GUIDANCE = {key: sys.intern(value) for key, value in TEMPLATE_GUIDANCE.items()}
+OPENZEPPELIN_V5_RULES = sys.intern(OPENZEPPELIN_V5_RULES)
+CUSTOM_CONTRACT_GUIDANCE = sys.intern(CUSTOM_CONTRACT_GUIDANCE)
 
-class DynamicPromptBuilder:
-    """Builds prompts based on contract profile and classification"""
-    
-    def __init__(self, debug: bool = False):
-        self.debug = debug
-    
-    def build_prompts(
-        self, 
-        json_spec: Dict, 
-        profile: 'ContractProfile',
-        classification: Dict,
-        coverage: 'SpecCoverage'
-    ) -> Tuple[str, str, List[str], List[str]]:
-        """
-        Build system and user prompts based on profile.
-        
-        Returns:
-            (system_prompt, user_prompt, imports, inheritance)
-        """
-        
-        if profile.is_template:
-            return self._build_template_prompts(json_spec, profile, coverage)
-        else:
-            return self._build_custom_prompts(json_spec, profile, classification, coverage)
-    
-    def _build_template_prompts(
-        self, 
-        json_spec: Dict, 
-        profile: 'ContractProfile',
-        coverage: 'SpecCoverage'
-    ) -> Tuple[str, str, List[str], List[str]]:
-        """Build prompts for template contracts (ERC20, Governor, etc.)"""
-        
-        # Get template-specific guidance
-        template_guidance = TEMPLATE_GUIDANCE.get(profile.category, "")
-        
-        # Build system prompt
-        system_prompt = f"""You are an expert Solidity developer specializing in {profile.category} contracts.
-
-TARGET: Solidity ^0.8.20 with OpenZeppelin v5
-
-{OPENZEPPELIN_V5_RULES}
-
-{template_guidance}
-
-PROFILE:
-{profile.describe()}
-
-REQUIREMENTS:
-- Use NatSpec documentation for all public functions
-- Use custom errors (not require strings)
-- Follow checks-effects-interactions pattern
-- Emit events for all state changes
-- Optimize for gas efficiency
-- Single-file output only
-- NO explanations, ONLY Solidity code
-"""
-
-        # Build user prompt
-        contract_name = json_spec.get('contract_name', 'Contract')
-        asset_name = json_spec.get('name', '')
-        asset_symbol = json_spec.get('symbol', '')
-        functions = json_spec.get('functions', [])
-        custom_function_names = [
-            f.get('name', '')
-            for f in functions
-            if f.get('name', '') not in {
-                'transfer', 'transferFrom', 'approve', 'balanceOf', 'allowance',
-                'ownerOf', 'safeTransferFrom'
-            }
-        ]
-        inherited_function_names = [
-            f.get('name', '')
-            for f in functions
-            if f.get('name', '') in {
-                'transfer', 'transferFrom', 'approve', 'balanceOf', 'allowance',
-                'ownerOf', 'safeTransferFrom'
-            }
-        ]
-        
-        user_prompt = f"""Generate a complete, compilable Solidity {profile.category} contract.
-
-SPECIFICATION:
-{json.dumps(json_spec, indent=2)}
-
-IMPLEMENTATION MAPPING:
-{json.dumps(coverage.to_dict(), indent=2)}
-
-CONTRACT NAME: {contract_name}
-ASSET NAME: {asset_name or 'use a sensible default'}
-ASSET SYMBOL: {asset_symbol or 'use a sensible default'}
-CUSTOM FUNCTIONS TO IMPLEMENT: {', '.join(custom_function_names) if custom_function_names else 'none'}
-STANDARD INHERITED FUNCTIONS TO KEEP INHERITED: {', '.join(inherited_function_names) if inherited_function_names else 'none'}
+# Invariant prompt sections are rendered once here; the builders below only
+# format the spec-dependent lines and join the pieces, instead of pushing
+# these multi-kilobyte blocks through an f-string on every call
 
+_TEMPLATE_USER_RULES = """
 CRITICAL REQUIREMENTS:
 1. Inherit from appropriate OpenZeppelin contracts
 2. Initialize all parent constructors correctly
@@ -347,37 +286,14 @@ CRITICAL REQUIREMENTS:
 OUTPUT: Complete Solidity source code only, no markdown.
 """
 
-        # Build imports and inheritance
-        imports = self._build_template_imports(profile)
-        inheritance = self._build_template_inheritance(profile)
-        
-        return system_prompt, user_prompt, imports, inheritance
-    
-    def _build_custom_prompts(
-        self, 
-        json_spec: Dict, 
-        profile: 'ContractProfile',
-        classification: Dict,
-        coverage: 'SpecCoverage'
-    ) -> Tuple[str, str, List[str], List[str]]:
-        """Build prompts for custom contracts"""
-        
-        subtype = profile.subtype or "custom business logic"
-        
-        # Build system prompt
-        system_prompt = f"""You are an expert Solidity developer specializing in custom smart contracts.
+# Fully static, so the whole custom system prompt is a single constant
+# (which also keeps it byte-identical for provider-side prompt caching)
+_CUSTOM_SYSTEM_PROMPT = f"""You are an expert Solidity developer specializing in custom smart contracts.
 
 TARGET: Solidity ^0.8.20
 
 {CUSTOM_CONTRACT_GUIDANCE}
 
-CONTRACT TYPE: {subtype.upper()}
-Classification Confidence: {classification.get('confidence', 0.5):.0%}
-Reasoning: {classification.get('reasoning', 'Custom contract')}
-
-PROFILE:
-{profile.describe()}
-
 REQUIREMENTS:
 - Design contract from scratch based on business requirements
 - Use appropriate data structures for the domain
@@ -389,48 +305,7 @@ REQUIREMENTS:
 - NO explanations, ONLY Solidity code
 """
 
-        # Extract detailed requirements
-        contract_name = json_spec.get('contract_name', 'CustomContract')
-        description = json_spec.get('description', '')
-        
-        # Check if spec is too large and truncate if needed
-        spec_str = json.dumps(json_spec, indent=2)
-        if estimate_tokens(spec_str) > 10000:  # ~40k chars
-            if self.debug:
-                print(f"Warning: Large spec detected, truncating for prompt...")
-            json_spec = truncate_spec_for_prompt(json_spec, max_chars=2000)
-        
-        state_vars = json_spec.get('state_variables', [])
-        functions = json_spec.get('functions', [])
-        events = json_spec.get('events', [])
-        roles = json_spec.get('roles', [])
-        
-        # Build detailed user prompt
-        user_prompt = f"""Generate a complete Solidity smart contract: {contract_name}
-
-DESCRIPTION:
-{description}
-
-FULL SPECIFICATION:
-{json.dumps(json_spec, indent=2)}
-
-IMPLEMENTATION REQUIREMENTS:
-
-STATE VARIABLES ({len(state_vars)} specified):
-{self._format_state_vars(state_vars)}
-
-FUNCTIONS ({len(functions)} specified):
-{self._format_functions(functions)}
-
-EVENTS ({len(events)} specified):
-{self._format_events(events)}
-
-ACCESS CONTROL:
-Type: {profile.access_control}
-Roles: {', '.join(r.get('name', '') for r in roles) if roles else 'Owner only'}
-
-IMPLEMENTATION COVERAGE:
-{json.dumps(coverage.to_dict(), indent=2)}
+_CUSTOM_USER_RULES = """
 
 CRITICAL REQUIREMENTS:
 1. Implement ALL specified state variables, functions, and events
@@ -473,35 +348,35 @@ CORRECT PATTERN:
 4. DO NOT create external functions requiring manual calls
 
 CORRECT EXAMPLE:
-function vote(uint256 candidateIndex) external {{
+function vote(uint256 candidateIndex) external {
     // FIRST: Check if period ended and auto-tabulate
-    if (block.timestamp > votingPeriodEnd && !winnerDeclared) {{
+    if (block.timestamp > votingPeriodEnd && !winnerDeclared) {
         _autoTabulate();
-    }}
-    
+    }
+
     // THEN: Check if voting still allowed
     if (block.timestamp > votingPeriodEnd) revert VotingPeriodEnded();
     if (hasVoted[msg.sender]) revert AlreadyVoted();
-    
+
     // Main voting logic
     hasVoted[msg.sender] = true;
     candidateVotes[candidates[candidateIndex]] += 1;
-}}
+}
 
 WRONG EXAMPLE (DO NOT DO THIS):
-function vote(...) external onlyDuringVotingPeriod {{
+function vote(...) external onlyDuringVotingPeriod {
     // ... voting logic ...
-    
+
     // WRONG: Checking AFTER vote (will never be true due to modifier)
-    if (block.timestamp > votingPeriodEnd) {{
+    if (block.timestamp > votingPeriodEnd) {
         _declareWinner();
-    }}
-}}
+    }
+}
 
 // WRONG: External function requiring manual call
-function declareWinner() external onlyAdmin {{
+function declareWinner() external onlyAdmin {
     _declareWinner();
-}}
+}
 
 KEY POINTS:
 - Check automatic conditions at the START of functions, not at the end
@@ -520,6 +395,147 @@ SECURITY - ACCESS CONTROL (CRITICAL):
 OUTPUT: Complete, compilable Solidity contract with all specified functionality.
 """
 
+
+class DynamicPromptBuilder:
+    """Builds prompts based on contract profile and classification"""
+    
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+    
+    def build_prompts(
+        self, 
+        json_spec: Dict, 
+        profile: 'ContractProfile',
+        classification: Dict,
+        coverage: 'SpecCoverage'
+    ) -> Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Build system and user prompts based on profile.
+        
+        Returns:
+            (system_prompt, user_prompt, imports, inheritance)
+        """
+        
+        if profile.is_template:
+            return self._build_template_prompts(json_spec, profile, coverage)
+        else:
+            return self._build_custom_prompts(json_spec, profile, classification, coverage)
+    
+    def _build_template_prompts(
+        self, 
+        json_spec: Dict, 
+        profile: 'ContractProfile',
+        coverage: 'SpecCoverage'
+    ) -> Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]:
+        """Build prompts for template contracts (ERC20, Governor, etc.)"""
+        
+        # Per-spec content (PROFILE) lives in the user prompt so this stays
+        # byte-identical for a given category and the provider's server-side
+        # prompt cache can reuse the prefix
+        system_prompt = _template_system_prompt(profile.category)
+
+        # Build user prompt
+        contract_name = json_spec.get('contract_name', 'Contract')
+        asset_name = json_spec.get('name', '')
+        asset_symbol = json_spec.get('symbol', '')
+        functions = json_spec.get('functions', [])
+        custom_function_names = [
+            f.get('name', '')
+            for f in functions
+            if f.get('name', '') not in {
+                'transfer', 'transferFrom', 'approve', 'balanceOf', 'allowance',
+                'ownerOf', 'safeTransferFrom'
+            }
+        ]
+        inherited_function_names = [
+            f.get('name', '')
+            for f in functions
+            if f.get('name', '') in {
+                'transfer', 'transferFrom', 'approve', 'balanceOf', 'allowance',
+                'ownerOf', 'safeTransferFrom'
+            }
+        ]
+        
+        # The dynamic lines are formatted individually and joined with the
+        # static rule block; only the small pieces go through an f-string
+        user_prompt = "".join((
+            f"Generate a complete, compilable Solidity {profile.category} contract.\n\nPROFILE:\n",
+            profile.describe(),
+            "\n\nSPECIFICATION:\n",
+            _dumps_spec(json_spec),
+            "\n\nIMPLEMENTATION MAPPING:\n",
+            coverage.summary_json,
+            f"\n\nCONTRACT NAME: {contract_name}\n"
+            f"ASSET NAME: {asset_name or 'use a sensible default'}\n"
+            f"ASSET SYMBOL: {asset_symbol or 'use a sensible default'}\n"
+            f"CUSTOM FUNCTIONS TO IMPLEMENT: {', '.join(custom_function_names) if custom_function_names else 'none'}\n"
+            f"STANDARD INHERITED FUNCTIONS TO KEEP INHERITED: {', '.join(inherited_function_names) if inherited_function_names else 'none'}\n",
+            _TEMPLATE_USER_RULES,
+        ))
+
+        # Build imports and inheritance
+        imports = self._build_template_imports(profile)
+        inheritance = self._build_template_inheritance(profile)
+        
+        return system_prompt, user_prompt, imports, inheritance
+    
+    def _build_custom_prompts(
+        self, 
+        json_spec: Dict, 
+        profile: 'ContractProfile',
+        classification: Dict,
+        coverage: 'SpecCoverage'
+    ) -> Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]:
+        """Build prompts for custom contracts"""
+        
+        subtype = profile.subtype or "custom business logic"
+
+        # Per-spec content (subtype, classification, profile) lives in the
+        # user prompt so the static system prompt is byte-identical across
+        # calls and the provider's server-side prompt cache can reuse it
+        system_prompt = _CUSTOM_SYSTEM_PROMPT
+
+        # Extract detailed requirements
+        contract_name = json_spec.get('contract_name', 'CustomContract')
+        description = json_spec.get('description', '')
+
+        # Check if spec is too large and truncate if needed; the serialized
+        # spec is reused below rather than dumped a second time
+        spec_str = _dumps_spec(json_spec)
+        if estimate_tokens(spec_str) > 10000:  # ~40k chars
+            if self.debug:
+                print(f"Warning: Large spec detected, truncating for prompt...")
+            json_spec = truncate_spec_for_prompt(json_spec, max_chars=2000)
+            spec_str = _dumps_spec(json_spec)
+
+        state_vars = json_spec.get('state_variables', [])
+        functions = json_spec.get('functions', [])
+        events = json_spec.get('events', [])
+        roles = json_spec.get('roles', [])
+        
+        # Dynamic lines are formatted individually and joined with the
+        # static rule block; only the small pieces go through an f-string
+        user_prompt = "".join((
+            f"Generate a complete Solidity smart contract: {contract_name}\n\n"
+            f"CONTRACT TYPE: {subtype.upper()}\n"
+            f"Classification Confidence: {classification.get('confidence', 0.5):.0%}\n"
+            f"Reasoning: {classification.get('reasoning', 'Custom contract')}\n\nPROFILE:\n",
+            profile.describe(),
+            f"\n\nDESCRIPTION:\n{description}\n\nFULL SPECIFICATION:\n",
+            spec_str,
+            f"\n\nIMPLEMENTATION REQUIREMENTS:\n\nSTATE VARIABLES ({len(state_vars)} specified):\n",
+            self._format_state_vars(state_vars),
+            f"\n\nFUNCTIONS ({len(functions)} specified):\n",
+            self._format_functions(functions),
+            f"\n\nEVENTS ({len(events)} specified):\n",
+            self._format_events(events),
+            f"\n\nACCESS CONTROL:\nType: {profile.access_control}\n"
+            f"Roles: {', '.join(r.get('name', '') for r in roles) if roles else 'Owner only'}\n\n"
+            "IMPLEMENTATION COVERAGE:\n",
+            coverage.summary_json,
+            _CUSTOM_USER_RULES,
+        ))
+
         # Build imports and inheritance
         imports = self._build_custom_imports(profile)
         inheritance = self._build_custom_inheritance(profile)
@@ -573,118 +589,260 @@ OUTPUT: Complete, compilable Solidity contract with all specified functionality.
             lines.append(f"  - {name}({param_str})")
         return "\n".join(lines)
     
-    def _build_template_imports(self, profile: 'ContractProfile') -> List[str]:
+    # The cached tuples are passed through as-is; conversion to the public
+    # list form happens once at the build_prompts_dynamic boundary, so
+    # repeat builds never copy or re-format them
+
+    def _build_template_imports(self, profile: 'ContractProfile') -> Tuple[str, ...]:
         """Build imports for template contracts"""
-        imports = []
-        
-        if profile.category == "ERC20":
-            imports.append("@openzeppelin/contracts/token/ERC20/ERC20.sol")
-            if "Burnable" in profile.extensions:
-                imports.append("@openzeppelin/contracts/token/ERC20/extensions/ERC20Burnable.sol")
-            if "Capped" in profile.extensions:
-                imports.append("@openzeppelin/contracts/token/ERC20/extensions/ERC20Capped.sol")
-        
-        elif profile.category == "ERC721":
-            imports.append("@openzeppelin/contracts/token/ERC721/ERC721.sol")
-            if "Enumerable" in profile.extensions:
-                imports.append("@openzeppelin/contracts/token/ERC721/extensions/ERC721Enumerable.sol")
-            if "URIStorage" in profile.extensions:
-                imports.append("@openzeppelin/contracts/token/ERC721/extensions/ERC721URIStorage.sol")
-        
-        elif profile.category == "Governor":
-            imports.extend([
-                "@openzeppelin/contracts/governance/Governor.sol",
-                "@openzeppelin/contracts/governance/extensions/GovernorSettings.sol",
-                "@openzeppelin/contracts/governance/extensions/GovernorVotes.sol",
-                "@openzeppelin/contracts/governance/extensions/GovernorVotesQuorumFraction.sol",
-            ])
-        
-        elif profile.category == "Staking":
-            imports.extend([
-                "@openzeppelin/contracts/token/ERC20/IERC20.sol",
-                "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol",
-            ])
-        
-        # Add access control
-        if profile.access_control == "single_owner":
-            imports.append("@openzeppelin/contracts/access/Ownable.sol")
-        elif profile.access_control == "role_based":
-            imports.append("@openzeppelin/contracts/access/AccessControl.sol")
-        
-        # Add security features
-        if "ReentrancyGuard" in profile.security_features:
-            imports.append("@openzeppelin/contracts/utils/ReentrancyGuard.sol")
-        if "Pausable" in profile.security_features:
-            imports.append("@openzeppelin/contracts/utils/Pausable.sol")
-        
-        return list(dict.fromkeys(imports))  # Dedupe
-    
-    def _build_template_inheritance(self, profile: 'ContractProfile') -> List[str]:
+        return _template_imports(
+            profile.category, profile.extensions,
+            profile.access_control, profile.security_features
+        )
+
+    def _build_template_inheritance(self, profile: 'ContractProfile') -> Tuple[str, ...]:
         """Build inheritance chain for template contracts"""
-        parts = []
-        
-        if profile.category == "ERC20":
-            parts.append("ERC20")
-            if "Burnable" in profile.extensions:
-                parts.append("ERC20Burnable")
-        elif profile.category == "ERC721":
-            parts.append("ERC721")
-            if "Enumerable" in profile.extensions:
-                parts.append("ERC721Enumerable")
-            if "URIStorage" in profile.extensions:
-                parts.append("ERC721URIStorage")
-        elif profile.category == "Governor":
-            parts.extend(["Governor", "GovernorSettings", "GovernorVotes", "GovernorVotesQuorumFraction"])
-        
-        # Add security features
-        if "ReentrancyGuard" in profile.security_features:
-            parts.append("ReentrancyGuard")
-        if "Pausable" in profile.security_features:
-            parts.append("Pausable")
-        
-        # Add access control (last for proper linearization)
-        if profile.access_control == "single_owner":
-            parts.append("Ownable")
-        elif profile.access_control == "role_based":
-            parts.append("AccessControl")
-        
-        return parts
-    
-    def _build_custom_imports(self, profile: 'ContractProfile') -> List[str]:
+        return _template_inheritance(
+            profile.category, profile.extensions,
+            profile.access_control, profile.security_features
+        )
+
+    def _build_custom_imports(self, profile: 'ContractProfile') -> Tuple[str, ...]:
         """Build imports for custom contracts"""
-        imports = []
-        
-        # Access control
-        if profile.access_control == "single_owner":
-            imports.append("@openzeppelin/contracts/access/Ownable.sol")
-        elif profile.access_control == "role_based":
-            imports.append("@openzeppelin/contracts/access/AccessControl.sol")
-        
-        # Security features
-        if "ReentrancyGuard" in profile.security_features:
-            imports.append("@openzeppelin/contracts/utils/ReentrancyGuard.sol")
-        if "Pausable" in profile.security_features:
-            imports.append("@openzeppelin/contracts/utils/Pausable.sol")
-        
-        return imports
-    
-    def _build_custom_inheritance(self, profile: 'ContractProfile') -> List[str]:
+        return _custom_imports(profile.access_control, profile.security_features)
+
+    def _build_custom_inheritance(self, profile: 'ContractProfile') -> Tuple[str, ...]:
         """Build inheritance for custom contracts"""
-        parts = []
-        
-        # Access control
-        if profile.access_control == "single_owner":
-            parts.append("Ownable")
-        elif profile.access_control == "role_based":
-            parts.append("AccessControl")
-        
-        # Security features
-        if "ReentrancyGuard" in profile.security_features:
-            parts.append("ReentrancyGuard")
-        if "Pausable" in profile.security_features:
-            parts.append("Pausable")
-        
-        return parts
+        return _custom_inheritance(profile.access_control, profile.security_features)
+
+
+def _render_template_system_prompt(category: str) -> str:
+    template_guidance = TEMPLATE_GUIDANCE.get(category, "")
+    return f"""You are an expert Solidity developer specializing in {category} contracts.
+
+TARGET: Solidity ^0.8.20 with OpenZeppelin v5
+
+{OPENZEPPELIN_V5_RULES}
+
+{template_guidance}
+
+REQUIREMENTS:
+- Use NatSpec documentation for all public functions
+- Use custom errors (not require strings)
+- Follow checks-effects-interactions pattern
+- Emit events for all state changes
+- Optimize for gas efficiency
+- Single-file output only
+- NO explanations, ONLY Solidity code
+"""
+
+
+# Every known category is rendered once at import, so the steady-state
+# path is a plain dict hit; an unexpected category renders on demand and
+# joins the table
+_TEMPLATE_SYSTEM_PROMPTS = {
+    category: _render_template_system_prompt(category) for category in TEMPLATE_GUIDANCE
+}
+
+
+def _template_system_prompt(category: str) -> str:
+    prompt = _TEMPLATE_SYSTEM_PROMPTS.get(category)
+    if prompt is None:
+        prompt = _TEMPLATE_SYSTEM_PROMPTS[category] = _render_template_system_prompt(category)
+    return prompt
+
+
+# Imports/inheritance depend only on a handful of closed profile fields
+# (category, extension/security frozensets, access control), so each
+# distinct combination is computed once per process and replayed from the
+# lru_cache as a tuple. Category-specific pieces live in per-category
+# handlers behind dispatch tables instead of one long if/elif chain, so
+# adding a category means adding a handler and a table entry.
+
+def _erc20_imports(extensions: FrozenSet[str], imports: List[str]) -> None:
+    imports.append("@openzeppelin/contracts/token/ERC20/ERC20.sol")
+    if "Burnable" in extensions:
+        imports.append("@openzeppelin/contracts/token/ERC20/extensions/ERC20Burnable.sol")
+    if "Capped" in extensions:
+        imports.append("@openzeppelin/contracts/token/ERC20/extensions/ERC20Capped.sol")
+
+
+def _erc721_imports(extensions: FrozenSet[str], imports: List[str]) -> None:
+    imports.append("@openzeppelin/contracts/token/ERC721/ERC721.sol")
+    if "Enumerable" in extensions:
+        imports.append("@openzeppelin/contracts/token/ERC721/extensions/ERC721Enumerable.sol")
+    if "URIStorage" in extensions:
+        imports.append("@openzeppelin/contracts/token/ERC721/extensions/ERC721URIStorage.sol")
+
+
+def _governor_imports(extensions: FrozenSet[str], imports: List[str]) -> None:
+    imports.extend([
+        "@openzeppelin/contracts/governance/Governor.sol",
+        "@openzeppelin/contracts/governance/extensions/GovernorSettings.sol",
+        "@openzeppelin/contracts/governance/extensions/GovernorVotes.sol",
+        "@openzeppelin/contracts/governance/extensions/GovernorVotesQuorumFraction.sol",
+    ])
+
+
+def _staking_imports(extensions: FrozenSet[str], imports: List[str]) -> None:
+    imports.extend([
+        "@openzeppelin/contracts/token/ERC20/IERC20.sol",
+        "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol",
+    ])
+
+
+_IMPORT_HANDLERS = {
+    "ERC20": _erc20_imports,
+    "ERC721": _erc721_imports,
+    "Governor": _governor_imports,
+    "Staking": _staking_imports,
+}
+
+
+@lru_cache(maxsize=None)
+def _template_imports(
+    category: str,
+    extensions: FrozenSet[str],
+    access_control: str,
+    security_features: FrozenSet[str]
+) -> Tuple[str, ...]:
+    imports: List[str] = []
+
+    handler = _IMPORT_HANDLERS.get(category)
+    if handler:
+        handler(extensions, imports)
+
+    # Add access control
+    if access_control == "single_owner":
+        imports.append("@openzeppelin/contracts/access/Ownable.sol")
+    elif access_control == "role_based":
+        imports.append("@openzeppelin/contracts/access/AccessControl.sol")
+
+    # Add security features
+    if "ReentrancyGuard" in security_features:
+        imports.append("@openzeppelin/contracts/utils/ReentrancyGuard.sol")
+    if "Pausable" in security_features:
+        imports.append("@openzeppelin/contracts/utils/Pausable.sol")
+
+    return tuple(dict.fromkeys(imports))  # Dedupe
+
+
+def _erc20_inheritance(extensions: FrozenSet[str], parts: List[str]) -> None:
+    parts.append("ERC20")
+    if "Burnable" in extensions:
+        parts.append("ERC20Burnable")
+
+
+def _erc721_inheritance(extensions: FrozenSet[str], parts: List[str]) -> None:
+    parts.append("ERC721")
+    if "Enumerable" in extensions:
+        parts.append("ERC721Enumerable")
+    if "URIStorage" in extensions:
+        parts.append("ERC721URIStorage")
+
+
+def _governor_inheritance(extensions: FrozenSet[str], parts: List[str]) -> None:
+    parts.extend(["Governor", "GovernorSettings", "GovernorVotes", "GovernorVotesQuorumFraction"])
+
+
+_INHERITANCE_HANDLERS = {
+    "ERC20": _erc20_inheritance,
+    "ERC721": _erc721_inheritance,
+    "Governor": _governor_inheritance,
+}
+
+
+@lru_cache(maxsize=None)
+def _template_inheritance(
+    category: str,
+    extensions: FrozenSet[str],
+    access_control: str,
+    security_features: FrozenSet[str]
+) -> Tuple[str, ...]:
+    parts: List[str] = []
+
+    handler = _INHERITANCE_HANDLERS.get(category)
+    if handler:
+        handler(extensions, parts)
+
+    # Add security features
+    if "ReentrancyGuard" in security_features:
+        parts.append("ReentrancyGuard")
+    if "Pausable" in security_features:
+        parts.append("Pausable")
+
+    # Add access control (last for proper linearization)
+    if access_control == "single_owner":
+        parts.append("Ownable")
+    elif access_control == "role_based":
+        parts.append("AccessControl")
+
+    return tuple(parts)
+
+
+@lru_cache(maxsize=None)
+def _custom_imports(access_control: str, security_features: FrozenSet[str]) -> Tuple[str, ...]:
+    imports = []
+
+    # Access control
+    if access_control == "single_owner":
+        imports.append("@openzeppelin/contracts/access/Ownable.sol")
+    elif access_control == "role_based":
+        imports.append("@openzeppelin/contracts/access/AccessControl.sol")
+
+    # Security features
+    if "ReentrancyGuard" in security_features:
+        imports.append("@openzeppelin/contracts/utils/ReentrancyGuard.sol")
+    if "Pausable" in security_features:
+        imports.append("@openzeppelin/contracts/utils/Pausable.sol")
+
+    return tuple(imports)
+
+
+@lru_cache(maxsize=None)
+def _custom_inheritance(access_control: str, security_features: FrozenSet[str]) -> Tuple[str, ...]:
+    parts = []
+
+    # Access control
+    if access_control == "single_owner":
+        parts.append("Ownable")
+    elif access_control == "role_based":
+        parts.append("AccessControl")
+
+    # Security features
+    if "ReentrancyGuard" in security_features:
+        parts.append("ReentrancyGuard")
+    if "Pausable" in security_features:
+        parts.append("Pausable")
+
+    return tuple(parts)
+
+
+# Whole-build cache: repair loops and batch retries rebuild prompts for
+# the same spec repeatedly, and the dominant cost is the indent=2 JSON
+# serialization of the spec and coverage
+_PROMPT_CACHE: "OrderedDict[bytes, Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]]" = OrderedDict()
+_PROMPT_CACHE_MAX = 128
+
+
+def _prompt_key(
+    json_spec: Dict,
+    profile: 'ContractProfile',
+    classification: Dict,
+    coverage: 'SpecCoverage'
+) -> bytes:
+    payload = {
+        "spec": json_spec,
+        "cov": coverage.to_dict(),
+        # describe() covers every profile field the builders read
+        "prof": profile.describe(),
+        "cls": (classification.get("confidence", 0.5), classification.get("reasoning", "")),
+    }
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 def build_prompts_dynamic(
@@ -696,9 +854,25 @@ def build_prompts_dynamic(
 ) -> Tuple[str, str, List[str], List[str]]:
     """
     Build prompts dynamically based on classification.
-    
+
     Returns:
         (system_prompt, user_prompt, imports, inheritance)
     """
+    key = _prompt_key(json_spec, profile, classification, coverage)
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None:
+        _PROMPT_CACHE.move_to_end(key)
+        system_prompt, user_prompt, imports, inheritance = cached
+        return system_prompt, user_prompt, list(imports), list(inheritance)
+
     builder = DynamicPromptBuilder(debug=debug)
-    return builder.build_prompts(json_spec, profile, classification, coverage)
+    system_prompt, user_prompt, imports, inheritance = builder.build_prompts(
+        json_spec, profile, classification, coverage
+    )
+
+    # The builder already hands back immutable tuples, so the cache entry
+    # stores them directly; only the caller-facing lists are fresh copies
+    _PROMPT_CACHE[key] = (system_prompt, user_prompt, imports, inheritance)
+    if len(_PROMPT_CACHE) > _PROMPT_CACHE_MAX:
+        _PROMPT_CACHE.popitem(last=False)
+    return system_prompt, user_prompt, list(imports), list(inheritance)
@@ -6,9 +6,111 @@ SmartBugs-Lite: Lightweight security analysis with Docker support for Windows co
 Uses SmartBugs-inspired architecture (YAML configs, Docker execution) but rewritten for our pipeline.
 """
 
-from .runner import run_stage3
+from typing import Dict, List, Optional
+
+from ._cache import (
+    cache_disabled,
+    cache_key,
+    is_known_clean,
+    load_cached_result,
+    mark_clean,
+    store_result,
+)
+from .analyzer import SecurityAnalyzer
+from .runner import run_stage3 as _run_stage3_uncached
 from .models import SecurityIssue, Severity, AnalysisResult, Stage3Result
 
+
+# Markers the analyzer appends to a tool id in tools_used when the tool
+# did not run to completion (see SecurityAnalyzer._run_tool)
+_FAILURE_SUFFIXES = ("-failed", "-error", "-partial")
+
+
+def _genuinely_succeeded(analysis: Optional[AnalysisResult], tool_list: List[str]) -> bool:
+    """True when every requested tool ran to completion.
+
+    AnalysisResult.success only means some tool produced a status, and
+    tools_used mixes plain tool ids with failure markers - a run where
+    every tool errored still reports success with zero issues. Cache and
+    clean-registry decisions need all requested tools present without a
+    failure marker.
+    """
+    if analysis is None or not analysis.success:
+        return False
+    completed = {t for t in analysis.tools_used if not t.endswith(_FAILURE_SUFFIXES)}
+    return all(tool in completed for tool in tool_list)
+
+
+def run_stage3(
+    solidity_code: str,
+    contract_name: str,
+    stage2_metadata: Optional[Dict] = None,
+    max_iterations: int = 2,
+    tools: Optional[List[str]] = None,
+    skip_auto_fix: bool = False,
+    fix_medium: bool = True
+) -> Stage3Result:
+    """Cached entry point: identical code + options reuse the stored result"""
+    key = None
+    tool_list = tools if tools is not None else SecurityAnalyzer.DEFAULT_TOOLS
+    if not cache_disabled():
+        # Clean registry is broader than the result cache: clean code has
+        # nothing to fix, so the outcome is the same for any fix options
+        if is_known_clean(solidity_code, tool_list):
+            print("\n♻️  Stage 3 skipped — contract previously analyzed clean")
+            clean_analysis = AnalysisResult(
+                contract_name=contract_name,
+                tools_used=list(tool_list),
+                issues=[],
+                success=True
+            )
+            return Stage3Result(
+                original_code=solidity_code,
+                final_code=solidity_code,
+                iterations=0,
+                initial_analysis=clean_analysis,
+                final_analysis=clean_analysis,
+                fixes_applied=[],
+                issues_resolved=0,
+                stage2_metadata=stage2_metadata,
+                compiles=None
+            )
+
+        key = cache_key(
+            solidity_code, tools, stage2_metadata,
+            max_iterations, skip_auto_fix, fix_medium
+        )
+        cached = load_cached_result(key)
+        if cached is not None:
+            print("\n♻️  Stage 3 cache hit — reusing previous analysis result")
+            return cached
+
+    result = _run_stage3_uncached(
+        solidity_code=solidity_code,
+        contract_name=contract_name,
+        stage2_metadata=stage2_metadata,
+        max_iterations=max_iterations,
+        tools=tools,
+        skip_auto_fix=skip_auto_fix,
+        fix_medium=fix_medium
+    )
+
+    if key is not None:
+        # Persist only runs where the tools actually completed; caching a
+        # failed analysis (Docker outage, image pull error) would replay
+        # the failure on every later run until the cache is cleared
+        analysis = result.final_analysis or result.initial_analysis
+        if _genuinely_succeeded(analysis, tool_list):
+            store_result(key, result)
+        # Register clean outcomes so future runs skip analysis outright -
+        # but only when every requested tool actually completed, so a run
+        # where the tools errored out can't poison the registry
+        final = result.final_analysis
+        if _genuinely_succeeded(final, tool_list) and not final.issues:
+            mark_clean(result.final_code, tool_list)
+    return result
+
+
 __all__ = [
     "run_stage3",
     "SecurityIssue",
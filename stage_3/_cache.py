@@ -0,0 +1,117 @@
+"""
+On-disk cache for Stage 3 results.
+
+A full slither+mythril pass can take 30-120s, and Stage 3 is repeatedly
+re-run on identical Solidity during development iteration. Results are
+pickled under .stage3_cache/ keyed by sha256 of the contract code plus the
+analysis options that influence the outcome. Set STAGE3_CACHE_DISABLE=1 to
+bypass.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional
+
+CACHE_DIR = Path(".stage3_cache")
+
+
+def cache_disabled() -> bool:
+    return os.getenv("STAGE3_CACHE_DISABLE") == "1"
+
+
+def cache_key(
+    solidity_code: str,
+    tools: Optional[List[str]],
+    stage2_metadata: Optional[dict],
+    max_iterations: int,
+    skip_auto_fix: bool,
+    fix_medium: bool,
+) -> str:
+    # Metadata feeds the fixer prompts, so it is part of the key; the
+    # underscore-prefixed entries (e.g. _verbose) only affect logging
+    metadata = {
+        k: v for k, v in (stage2_metadata or {}).items()
+        if not k.startswith("_")
+    }
+    payload = "|".join(
+        [
+            solidity_code,
+            ",".join(sorted(tools or [])),
+            json.dumps(metadata, sort_keys=True, default=str),
+            str(max_iterations),
+            str(skip_auto_fix),
+            str(fix_medium),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_result(key: str):
+    """Return the cached Stage3Result for key, or None on miss/corruption"""
+    try:
+        with open(CACHE_DIR / f"{key}.pkl", "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def store_result(key: str, result):
+    """Best-effort write; a failed cache write never fails Stage 3"""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(CACHE_DIR / f"{key}.pkl", "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Known-clean registry
+#
+# Broader than the full result cache above: a contract that analyzed clean
+# has nothing to fix, so the outcome is identical whatever the fix options
+# are. The registry maps sha256(code) -> list of tool sets it was clean for.
+# ---------------------------------------------------------------------------
+
+CLEAN_REGISTRY = CACHE_DIR / "clean.json"
+
+
+def code_hash(solidity_code: str) -> str:
+    return hashlib.sha256(solidity_code.encode("utf-8")).hexdigest()
+
+
+def _tool_set(tools) -> str:
+    return ",".join(sorted(tools))
+
+
+def _load_clean_registry() -> dict:
+    try:
+        with open(CLEAN_REGISTRY, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def is_known_clean(solidity_code: str, tools) -> bool:
+    """True if this exact code already analyzed clean with these tools"""
+    entry = _load_clean_registry().get(code_hash(solidity_code))
+    return bool(entry) and _tool_set(tools) in entry
+
+
+def mark_clean(solidity_code: str, tools):
+    """Best-effort append to the clean registry"""
+    registry = _load_clean_registry()
+    entry = registry.setdefault(code_hash(solidity_code), [])
+    tool_set = _tool_set(tools)
+    if tool_set in entry:
+        return
+    entry.append(tool_set)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(CLEAN_REGISTRY, "w", encoding="utf-8") as f:
+            json.dump(registry, f, indent=2)
+    except OSError:
+        pass
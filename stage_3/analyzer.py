@@ -5,6 +5,7 @@ Security Analyzer
 Orchestrates Docker-based tool execution and parsing
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from .docker_executor import DockerExecutor
@@ -84,175 +85,212 @@ class SecurityAnalyzer:
                 error="No tools available. Check tool configs in stage_3/tools/"
             )
         
-        print(f"\n  🔍 Running: {', '.join([t.id for t in tool_configs])}")
-        
+        print(f"\n  🔍 Running: {', '.join([t.id for t in tool_configs])} (in parallel)")
+
         all_issues: List[SecurityIssue] = []
         tools_succeeded: List[str] = []
         all_warnings: List[str] = []
-        
-        # Run each tool
-        for tool_config in tool_configs:
-            tool_id = tool_config.id
-            print(f"    • {tool_id}...", end=" ", flush=True)
-            
-            try:
-                # Execute in Docker
-                exit_code, logs, output = self.docker.execute(
-                    solidity_code,
-                    tool_config.to_dict(),
-                    timeout=timeout
-                )
-                
-                # Debug: Show last few log lines if verbose
-                if self.verbose and logs:
-                    last_logs = "\n".join(logs[-10:])
-                    print(f"    [DEBUG] Exit code: {exit_code}")
-                    print(f"    [DEBUG] Log lines: {len(logs)}")
-                    print(f"    [DEBUG] Output size: {len(output) if output else 0} bytes")
-                    print(f"    [DEBUG] Last 10 log lines:\n{last_logs}")
-                
-                # Parse output
-                parser_class = self.PARSERS.get(tool_id)
-                if not parser_class:
-                    print(f"✗ (no parser)")
-                    all_warnings.append(f"{tool_id}: no parser available")
-                    continue
-                
-                parser = parser_class()
-                
-                # SmartBugs parsers expect: exit_code, log (list[str]), output (bytes)
-                # Convert logs to list of strings
-                log_lines = logs if logs else []
-                
-                # For tools that output to file (like Slither), use output bytes
-                # For tools that output to stdout (like Mythril), use logs
-                parse_result = None
-                
-                if output and tool_config.output:
-                    # Tool writes to file (e.g., Slither -> /output.json)
-                    # IMPORTANT: For file-based tools like Slither, we ONLY use the extracted JSON file
-                    # We ignore stdout/stderr entirely to avoid mixing text output with JSON
-                    # Output is a tar archive, extract it
-                    output_content = self._extract_output_from_tar(output, tool_config.output)
-                    if output_content:
-                        if self.verbose:
-                            print(f"    [DEBUG] Extracted output file, size: {len(output_content)} bytes")
-                            print(f"    [DEBUG] Output preview: {output_content[:200]}")
-                        # For file-based tools, ONLY pass the extracted JSON file content
-                        # Do NOT pass logs/stdout as it may contain human-readable text
-                        parse_result = parser.parse(
-                            exit_code=exit_code,
-                            stdout=output_content,  # This is the JSON file content, not stdout
-                            stderr=""
-                        )
-                    else:
-                        # Fallback to logs - check if JSON is in logs
-                        # This should rarely happen if file extraction works correctly
-                        if self.verbose:
-                            print(f"    [DEBUG] Output file not found in tar, checking logs for JSON")
-                            print(f"    [DEBUG] Log lines: {len(log_lines)}")
-                            if log_lines:
-                                print(f"    [DEBUG] First 5 log lines:")
-                                for i, line in enumerate(log_lines[:5]):
-                                    print(f"      [{i}] {line[:100]}")
-                            # Look for JSON in logs
-                            for line in log_lines:
-                                if line.strip().startswith('{'):
-                                    print(f"    [DEBUG] Found JSON-like line in logs: {line[:100]}")
-                        # Combine all logs as stdout (fallback only)
-                        stdout = "\n".join(log_lines) if log_lines else ""
-                        parse_result = parser.parse(
-                            exit_code=exit_code,
-                            stdout=stdout,
-                            stderr=""
-                        )
+
+        # The tools have no data dependency on each other, so run them
+        # concurrently: wall time becomes max(tool) instead of sum(tool).
+        # Each Docker execution gets its own temp dir, so nothing is shared.
+        with ThreadPoolExecutor(max_workers=len(tool_configs)) as executor:
+            futures = [
+                executor.submit(self._run_tool, tool_config, solidity_code, timeout)
+                for tool_config in tool_configs
+            ]
+            # Collect in submission order so the report stays deterministic
+            for future in futures:
+                issues, statuses, warnings, out = future.result()
+                print("\n".join(out))
+                all_issues.extend(issues)
+                tools_succeeded.extend(statuses)
+                all_warnings.extend(warnings)
+
+        return AnalysisResult(
+            contract_name=contract_name,
+            tools_used=tools_succeeded,
+            issues=self._dedupe_issues(all_issues),
+            success=len(tools_succeeded) > 0,
+            warnings=all_warnings if all_warnings else None
+        )
+
+    def _run_tool(self, tool_config, solidity_code: str, timeout: int):
+        """
+        Execute one tool in Docker and parse its output.
+
+        Runs on a worker thread, so all progress/debug text is collected in
+        `out` and printed by the caller instead of interleaving with the
+        other tools. Returns (issues, status_entries, warnings, out).
+        """
+        tool_id = tool_config.id
+        issues: List[SecurityIssue] = []
+        statuses: List[str] = []
+        warnings: List[str] = []
+        out: List[str] = []
+
+        def done(status: str):
+            out.insert(0, f"    • {tool_id}... {status}")
+            return issues, statuses, warnings, out
+
+        try:
+            # Execute in Docker
+            exit_code, logs, output = self.docker.execute(
+                solidity_code,
+                tool_config.to_dict(),
+                timeout=timeout
+            )
+
+            # Debug: Show last few log lines if verbose
+            if self.verbose and logs:
+                last_logs = "\n".join(logs[-10:])
+                out.append(f"    [DEBUG] Exit code: {exit_code}")
+                out.append(f"    [DEBUG] Log lines: {len(logs)}")
+                out.append(f"    [DEBUG] Output size: {len(output) if output else 0} bytes")
+                out.append(f"    [DEBUG] Last 10 log lines:\n{last_logs}")
+
+            # Parse output
+            parser_class = self.PARSERS.get(tool_id)
+            if not parser_class:
+                warnings.append(f"{tool_id}: no parser available")
+                return done("✗ (no parser)")
+
+            parser = parser_class()
+
+            # SmartBugs parsers expect: exit_code, log (list[str]), output (bytes)
+            # Convert logs to list of strings
+            log_lines = logs if logs else []
+
+            # For tools that output to file (like Slither), use output bytes
+            # For tools that output to stdout (like Mythril), use logs
+            parse_result = None
+
+            if output and tool_config.output:
+                # Tool writes to file (e.g., Slither -> /output.json)
+                # IMPORTANT: For file-based tools like Slither, we ONLY use the extracted JSON file
+                # We ignore stdout/stderr entirely to avoid mixing text output with JSON
+                # Output is a tar archive, extract it
+                output_content = self._extract_output_from_tar(output, tool_config.output)
+                if output_content:
+                    if self.verbose:
+                        out.append(f"    [DEBUG] Extracted output file, size: {len(output_content)} bytes")
+                        out.append(f"    [DEBUG] Output preview: {output_content[:200]}")
+                    # For file-based tools, ONLY pass the extracted JSON file content
+                    # Do NOT pass logs/stdout as it may contain human-readable text
+                    parse_result = parser.parse(
+                        exit_code=exit_code,
+                        stdout=output_content,  # This is the JSON file content, not stdout
+                        stderr=""
+                    )
                 else:
-                    # Tool outputs to stdout (e.g., Mythril, Semgrep)
-                    stdout = "\n".join(log_lines) if log_lines else ""
+                    # Fallback to logs - check if JSON is in logs
+                    # This should rarely happen if file extraction works correctly
                     if self.verbose:
-                        print(f"    [DEBUG] Using stdout from logs, length: {len(stdout)}")
-                        if stdout:
-                            print(f"    [DEBUG] First 200 chars: {stdout[:200]}")
+                        out.append(f"    [DEBUG] Output file not found in tar, checking logs for JSON")
+                        out.append(f"    [DEBUG] Log lines: {len(log_lines)}")
+                        if log_lines:
+                            out.append(f"    [DEBUG] First 5 log lines:")
+                            for i, line in enumerate(log_lines[:5]):
+                                out.append(f"      [{i}] {line[:100]}")
+                        # Look for JSON in logs
+                        for line in log_lines:
+                            if line.strip().startswith('{'):
+                                out.append(f"    [DEBUG] Found JSON-like line in logs: {line[:100]}")
+                    # Combine all logs as stdout (fallback only)
+                    stdout = "\n".join(log_lines) if log_lines else ""
                     parse_result = parser.parse(
                         exit_code=exit_code,
                         stdout=stdout,
                         stderr=""
                     )
-                
-                if not parse_result:
-                    print(f"✗ (parsing failed)")
-                    all_warnings.append(f"{tool_id}: parsing failed")
-                    # Graceful degradation: mark as partial success
-                    tools_succeeded.append(f"{tool_id}-failed")
-                    if self.verbose:
-                        print(f"    [DEBUG] Parse result is None - parser returned nothing")
-                        print(f"    [DEBUG] Exit code: {exit_code}")
-                        print(f"    [DEBUG] Output size: {len(output) if output else 0} bytes")
-                        print(f"    [DEBUG] Log lines: {len(logs)}")
-                        if logs:
-                            print(f"    [DEBUG] Last 5 log lines:")
-                            for line in logs[-5:]:
-                                print(f"      {line[:100]}")
-                    continue
-                
-                if parse_result.fails:
-                    fail_msg = list(parse_result.fails)[:1]
-                    if self.verbose:
-                        print(f"    [DEBUG] Parse fails: {fail_msg}")
-                        print(f"    [DEBUG] All fails: {parse_result.fails}")
-                        if output:
-                            print(f"    [DEBUG] Output size: {len(output)} bytes")
-                        if logs:
-                            print(f"    [DEBUG] Log lines: {len(logs)}")
-                            if len(logs) > 0:
-                                print(f"    [DEBUG] Last log line: {logs[-1][:200]}")
-                    print(f"⚠️  (partial: {fail_msg})")
-                    all_warnings.append(f"{tool_id}: parsing issues - {fail_msg}")
-                    # Still add any issues found, even with parse failures
-                    if parse_result.issues:
-                        all_issues.extend(parse_result.issues)
-                        tools_succeeded.append(f"{tool_id}-partial")
-                        print(f"    → Found {len(parse_result.issues)} issues despite errors")
-                    else:
-                        tools_succeeded.append(f"{tool_id}-failed")
-                        if self.verbose:
-                            print(f"    [DEBUG] No issues found despite parse result existing")
-                            print(f"    [DEBUG] Errors: {parse_result.errors}")
-                            print(f"    [DEBUG] Infos: {parse_result.infos}")
-                    continue
-                
-                # Add issues
-                all_issues.extend(parse_result.issues)
-                tools_succeeded.append(tool_id)
-                
-                if len(parse_result.issues) > 0:
-                    print(f"✓ ({len(parse_result.issues)} issues)")
+            else:
+                # Tool outputs to stdout (e.g., Mythril, Semgrep)
+                stdout = "\n".join(log_lines) if log_lines else ""
+                if self.verbose:
+                    out.append(f"    [DEBUG] Using stdout from logs, length: {len(stdout)}")
+                    if stdout:
+                        out.append(f"    [DEBUG] First 200 chars: {stdout[:200]}")
+                parse_result = parser.parse(
+                    exit_code=exit_code,
+                    stdout=stdout,
+                    stderr=""
+                )
+
+            if not parse_result:
+                warnings.append(f"{tool_id}: parsing failed")
+                # Graceful degradation: mark as partial success
+                statuses.append(f"{tool_id}-failed")
+                if self.verbose:
+                    out.append(f"    [DEBUG] Parse result is None - parser returned nothing")
+                    out.append(f"    [DEBUG] Exit code: {exit_code}")
+                    out.append(f"    [DEBUG] Output size: {len(output) if output else 0} bytes")
+                    out.append(f"    [DEBUG] Log lines: {len(logs)}")
+                    if logs:
+                        out.append(f"    [DEBUG] Last 5 log lines:")
+                        for line in logs[-5:]:
+                            out.append(f"      {line[:100]}")
+                return done("✗ (parsing failed)")
+
+            if parse_result.fails:
+                fail_msg = list(parse_result.fails)[:1]
+                if self.verbose:
+                    out.append(f"    [DEBUG] Parse fails: {fail_msg}")
+                    out.append(f"    [DEBUG] All fails: {parse_result.fails}")
+                    if output:
+                        out.append(f"    [DEBUG] Output size: {len(output)} bytes")
+                    if logs:
+                        out.append(f"    [DEBUG] Log lines: {len(logs)}")
+                        if len(logs) > 0:
+                            out.append(f"    [DEBUG] Last log line: {logs[-1][:200]}")
+                warnings.append(f"{tool_id}: parsing issues - {fail_msg}")
+                # Still add any issues found, even with parse failures
+                if parse_result.issues:
+                    issues.extend(parse_result.issues)
+                    statuses.append(f"{tool_id}-partial")
+                    out.append(f"    → Found {len(parse_result.issues)} issues despite errors")
                 else:
-                    print(f"✓ (0 issues)")
+                    statuses.append(f"{tool_id}-failed")
                     if self.verbose:
-                        print(f"    [DEBUG] Tool completed but found no issues")
-                        print(f"    [DEBUG] Errors: {parse_result.errors}")
-                        print(f"    [DEBUG] Infos: {parse_result.infos}")
-                        print(f"    [DEBUG] Exit code: {exit_code}")
-            
-            except Exception as e:
-                error_msg = str(e)[:50]
-                print(f"✗ ({error_msg})")
-                all_warnings.append(f"{tool_id}: {str(e)}")
-                # Mark as attempted but failed
-                tools_succeeded.append(f"{tool_id}-error")
-                if self.verbose:
-                    import traceback
-                    print(f"    [DEBUG] Exception: {traceback.format_exc()}")
-                continue
-        
-        return AnalysisResult(
-            contract_name=contract_name,
-            tools_used=tools_succeeded,
-            issues=all_issues,
-            success=len(tools_succeeded) > 0,
-            warnings=all_warnings if all_warnings else None
-        )
+                        out.append(f"    [DEBUG] No issues found despite parse result existing")
+                        out.append(f"    [DEBUG] Errors: {parse_result.errors}")
+                        out.append(f"    [DEBUG] Infos: {parse_result.infos}")
+                return done(f"⚠️  (partial: {fail_msg})")
+
+            # Add issues
+            issues.extend(parse_result.issues)
+            statuses.append(tool_id)
+
+            if len(parse_result.issues) > 0:
+                return done(f"✓ ({len(parse_result.issues)} issues)")
+
+            if self.verbose:
+                out.append(f"    [DEBUG] Tool completed but found no issues")
+                out.append(f"    [DEBUG] Errors: {parse_result.errors}")
+                out.append(f"    [DEBUG] Infos: {parse_result.infos}")
+                out.append(f"    [DEBUG] Exit code: {exit_code}")
+            return done("✓ (0 issues)")
+
+        except Exception as e:
+            error_msg = str(e)[:50]
+            warnings.append(f"{tool_id}: {str(e)}")
+            # Mark as attempted but failed
+            statuses.append(f"{tool_id}-error")
+            if self.verbose:
+                import traceback
+                out.append(f"    [DEBUG] Exception: {traceback.format_exc()}")
+            return done(f"✗ ({error_msg})")
+
+    @staticmethod
+    def _dedupe_issues(issues: List[SecurityIssue]) -> List[SecurityIssue]:
+        """Drop exact duplicate findings in O(n) with a signature hash-set"""
+        seen = set()
+        unique: List[SecurityIssue] = []
+        for issue in issues:
+            signature = (issue.tool, issue.title, issue.line, issue.contract, issue.function)
+            if signature not in seen:
+                seen.add(signature)
+                unique.append(issue)
+        return unique
     
     def _extract_output_from_tar(self, output: bytes, output_path: str) -> Optional[str]:
         """Extract output file from tar archive"""
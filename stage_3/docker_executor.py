@@ -6,9 +6,12 @@ SmartBugs-inspired Docker execution for security tools.
 Handles Windows compatibility by running tools in Docker containers.
 """
 
+import atexit
+import hashlib
 import os
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 from typing import Optional, Tuple, List
 
@@ -20,6 +23,23 @@ try:
 except ImportError:
     DOCKER_AVAILABLE = False
 
+# Contract source staged once per unique code hash and shared by all tool
+# containers (and by fix iterations that didn't change the code), instead
+# of re-writing the same bytes into every per-tool volume.
+_STAGED_SOURCES = set()
+_STAGED_LOCK = threading.Lock()
+
+
+def _cleanup_staged_sources():
+    for path in _STAGED_SOURCES:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+atexit.register(_cleanup_staged_sources)
+
 
 class DockerExecutor:
     """Execute security tools in Docker containers (SmartBugs-style)"""
@@ -60,11 +80,15 @@ class DockerExecutor:
         
         
         try:
-            # Write contract file
+            # Link the staged contract file into this tool's volume
             contract_filename = "contract.sol"
             contract_path = os.path.join(sbdir, contract_filename)
-            with open(contract_path, "w", encoding="utf8") as f:
-                f.write(solidity_code)
+            staged_path = self._stage_source(solidity_code)
+            try:
+                os.link(staged_path, contract_path)
+            except OSError:
+                # Cross-device or unsupported filesystem: fall back to a copy
+                shutil.copyfile(staged_path, contract_path)
             
             # Copy scripts/bin if specified (like SmartBugs __docker_volume)
             bin_dest = os.path.join(sbdir, "bin")
@@ -203,8 +227,35 @@ class DockerExecutor:
             except Exception:
                 pass
     
+    def _stage_source(self, solidity_code: str) -> str:
+        """
+        Write the contract once per unique source and reuse it.
+
+        All four tools (and any fix iteration that left the code unchanged)
+        hardlink the same staged file instead of re-writing the bytes.
+        Staged files are removed at interpreter exit.
+        """
+        digest = hashlib.sha256(solidity_code.encode("utf8")).hexdigest()[:16]
+        staged_path = os.path.join(tempfile.gettempdir(), f"sb_contract_{digest}.sol")
+        with _STAGED_LOCK:
+            if not os.path.exists(staged_path):
+                # Write-then-rename so concurrent executors never see a
+                # partially written file
+                tmp_path = f"{staged_path}.{os.getpid()}.{threading.get_ident()}"
+                with open(tmp_path, "w", encoding="utf8") as f:
+                    f.write(solidity_code)
+                os.replace(tmp_path, staged_path)
+            _STAGED_SOURCES.add(staged_path)
+        return staged_path
+
+    # Images verified once per process; every tool run was previously a
+    # Docker API round-trip just to re-confirm the image exists
+    _checked_images = set()
+
     def _ensure_image(self, image: str) -> None:
-        """Ensure Docker image is available"""
+        """Ensure Docker image is available (checked once per process)"""
+        if image in DockerExecutor._checked_images:
+            return
         try:
             images = self._client.images.list(image)
             if not images:
@@ -213,6 +264,7 @@ class DockerExecutor:
                 self._client.images.pull(image)
         except Exception as e:
             raise RuntimeError(f"Failed to load Docker image {image}: {e}")
+        DockerExecutor._checked_images.add(image)
     
     def _build_command(
         self,
@@ -5,16 +5,35 @@ Security Fixer
 LLM-based vulnerability fixer with Stage 2 metadata integration
 """
 
+import asyncio
 import os
 from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from common.llm_client import chat_completion_cached, get_openai_client
 
 from .models import SecurityIssue
 
 load_dotenv()
-_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY") or os.getenv("API_KEY")) if os.getenv("OPENAI_API_KEY") or os.getenv("API_KEY") else None
+_API_KEY = os.getenv("OPENAI_API_KEY") or os.getenv("API_KEY")
+_client = get_openai_client(_API_KEY) if _API_KEY else None
+
+# Constant part of the system prompt, hoisted so every fix call shares one
+# string object and only the metadata context (when present) is appended
+_SYSTEM_PROMPT_BASE = """You are a Solidity security expert. Fix vulnerabilities while:
+1. Preserving all functionality and public API
+2. Maintaining OpenZeppelin v5 compatibility (^0.8.20)
+3. Not introducing new bugs
+4. Following the contract's existing architecture
+
+COMMON FIXES:
+- Reentrancy: Add ReentrancyGuard, use checks-effects-interactions
+- Access Control: Add onlyOwner or AccessControl modifiers
+- Unchecked Calls: Check return values, use SafeERC20
+- Integer Issues: Use ^0.8.20 built-in checks
+- tx.origin: Replace with msg.sender
+
+Return ONLY the fixed Solidity code (no markdown, no explanations)."""
 
 
 class SecurityFixer:
@@ -54,7 +73,11 @@ class SecurityFixer:
         )
         
         try:
-            response = self.client.chat.completions.create(
+            # Identical (code, issues, metadata) requests hash to the same
+            # key, so retries and near-duplicate contracts across runs are
+            # served from the shared memory/disk cache instead of the API
+            response = chat_completion_cached(
+                self.client,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -72,7 +95,23 @@ class SecurityFixer:
         except Exception as e:
             print(f"  ✗ Fix failed: {e}")
             return solidity_code
-    
+
+    async def fix_issues_batch(self, items: List[Dict], max_concurrency: int = 4) -> List[str]:
+        """Fix several contracts concurrently.
+
+        Each item is a dict of fix_issues keyword arguments. The blocking
+        client calls run in worker threads behind a semaphore, so a batch
+        overlaps its network round trips instead of serializing them;
+        results come back in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fix_one(item: Dict) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self.fix_issues, **item)
+
+        return list(await asyncio.gather(*(_fix_one(item) for item in items)))
+
     def _build_metadata_context(self, metadata: Optional[Dict]) -> str:
         """Build context from Stage 2 metadata"""
         if not metadata:
@@ -113,25 +152,9 @@ class SecurityFixer:
     
     def _build_system_prompt(self, metadata_context: str) -> str:
         """Build system prompt"""
-        base = """You are a Solidity security expert. Fix vulnerabilities while:
-1. Preserving all functionality and public API
-2. Maintaining OpenZeppelin v5 compatibility (^0.8.20)
-3. Not introducing new bugs
-4. Following the contract's existing architecture
-
-COMMON FIXES:
-- Reentrancy: Add ReentrancyGuard, use checks-effects-interactions
-- Access Control: Add onlyOwner or AccessControl modifiers
-- Unchecked Calls: Check return values, use SafeERC20
-- Integer Issues: Use ^0.8.20 built-in checks
-- tx.origin: Replace with msg.sender
-
-Return ONLY the fixed Solidity code (no markdown, no explanations)."""
-        
         if metadata_context:
-            base += f"\n\nCONTRACT CONTEXT:\n{metadata_context}"
-        
-        return base
+            return f"{_SYSTEM_PROMPT_BASE}\n\nCONTRACT CONTEXT:\n{metadata_context}"
+        return _SYSTEM_PROMPT_BASE
     
     def _build_user_prompt(
         self, code: str, issues_text: str, contract_name: str, metadata_context: str
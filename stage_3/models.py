@@ -2,6 +2,7 @@
 Data Models for Stage 3
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional
@@ -33,6 +34,10 @@ class Severity(Enum):
             return cls.INFO
 
 
+# Built once so per-issue membership checks don't rebuild a list
+_CRITICAL_HIGH = frozenset({Severity.CRITICAL, Severity.HIGH})
+
+
 @dataclass
 class SecurityIssue:
     """A single security issue detected by a tool"""
@@ -80,25 +85,30 @@ class AnalysisResult:
     def get_critical_high(self) -> List[SecurityIssue]:
         """Get only CRITICAL and HIGH severity issues"""
         return [
-            i for i in self.issues 
-            if i.severity in [Severity.CRITICAL, Severity.HIGH]
+            i for i in self.issues
+            if i.severity in _CRITICAL_HIGH
         ]
     
     def get_by_severity(self, severity: Severity) -> List[SecurityIssue]:
         """Get issues by severity"""
         return [i for i in self.issues if i.severity == severity]
-    
+
+    def severity_counts(self) -> Counter:
+        """Count issues per severity in one pass over the issue list"""
+        return Counter(i.severity for i in self.issues)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        counts = self.severity_counts()
         return {
             "contract_name": self.contract_name,
             "tools_used": self.tools_used,
             "total_issues": len(self.issues),
-            "critical": len(self.get_by_severity(Severity.CRITICAL)),
-            "high": len(self.get_by_severity(Severity.HIGH)),
-            "medium": len(self.get_by_severity(Severity.MEDIUM)),
-            "low": len(self.get_by_severity(Severity.LOW)),
-            "info": len(self.get_by_severity(Severity.INFO)),
+            "critical": counts[Severity.CRITICAL],
+            "high": counts[Severity.HIGH],
+            "medium": counts[Severity.MEDIUM],
+            "low": counts[Severity.LOW],
+            "info": counts[Severity.INFO],
             "issues": [i.to_dict() for i in self.issues],
             "success": self.success,
             "error": self.error,
@@ -1,9 +1,23 @@
+import re
+from hashlib import sha1
 from typing import Dict, List, Optional
 
 from .analyzer import SecurityAnalyzer
 from .fixer import SecurityFixer
 from .models import AnalysisResult, Severity, Stage3Result
 
+_COMMENTS_AND_WS = re.compile(r"//.*?$|/\*.*?\*/|\s+", re.M | re.S)
+
+
+def _semantic_hash(code: str) -> str:
+    """Hash of the code with comments stripped and whitespace collapsed.
+
+    Two versions with the same semantic hash produce identical findings,
+    so a fix iteration that only touched comments/formatting does not need
+    another full tool pass.
+    """
+    return sha1(_COMMENTS_AND_WS.sub(" ", code).encode("utf-8")).hexdigest()
+
 
 def run_stage3(
     solidity_code: str,
@@ -48,12 +62,14 @@ def run_stage3(
             compiles=None
         )
     
+    # One pass over the issues instead of five get_by_severity scans
+    severity_counts = initial_analysis.severity_counts()
     print(f"\n  Found {len(initial_analysis.issues)} total issues:")
-    print(f"    • Critical: {len(initial_analysis.get_by_severity(Severity.CRITICAL))}")
-    print(f"    • High: {len(initial_analysis.get_by_severity(Severity.HIGH))}")
-    print(f"    • Medium: {len(initial_analysis.get_by_severity(Severity.MEDIUM))}")
-    print(f"    • Low: {len(initial_analysis.get_by_severity(Severity.LOW))}")
-    print(f"    • Info: {len(initial_analysis.get_by_severity(Severity.INFO))}")
+    print(f"    • Critical: {severity_counts[Severity.CRITICAL]}")
+    print(f"    • High: {severity_counts[Severity.HIGH]}")
+    print(f"    • Medium: {severity_counts[Severity.MEDIUM]}")
+    print(f"    • Low: {severity_counts[Severity.LOW]}")
+    print(f"    • Info: {severity_counts[Severity.INFO]}")
     
     # Skip auto-fix if requested
     if skip_auto_fix:
@@ -78,13 +94,17 @@ def run_stage3(
     
     iteration = 0
     current_analysis = initial_analysis
-    
+    prev_hash = _semantic_hash(current_code)
+
+    fixable = (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM)
+
     while iteration < max_iterations:
         # Always fix CRITICAL, HIGH, and MEDIUM severity issues
-        critical = current_analysis.get_by_severity(Severity.CRITICAL)
-        high = current_analysis.get_by_severity(Severity.HIGH)
-        medium = current_analysis.get_by_severity(Severity.MEDIUM)
-        high_priority = critical + high + medium
+        high_priority = [
+            i for i in current_analysis.issues if i.severity in fixable
+        ]
+        # Keep the critical → high → medium grouping the fixer expects
+        high_priority.sort(key=lambda i: fixable.index(i.severity))
         
         if not high_priority:
             print(f"\n  ✓ No critical/high/medium issues after {iteration} iterations")
@@ -105,7 +125,15 @@ def run_stage3(
             break
         
         current_code = fixed_code
-        
+
+        # Cosmetic-only change: the tools would report the same findings,
+        # so keep the fixed code but reuse the previous analysis
+        current_hash = _semantic_hash(current_code)
+        if current_hash == prev_hash:
+            print(f"  ✓ Iteration {iteration}: only comments/formatting changed — skipping re-analysis")
+            break
+        prev_hash = current_hash
+
         print(f"\n  🔍 Re-analyzing...")
         current_analysis = analyzer.analyze(current_code, contract_name, tools)
         
@@ -115,9 +143,9 @@ def run_stage3(
             break
         
         # Count issues after fix (CRITICAL + HIGH + MEDIUM)
-        issues_after = (len(current_analysis.get_by_severity(Severity.CRITICAL)) +
-                       len(current_analysis.get_by_severity(Severity.HIGH)) +
-                       len(current_analysis.get_by_severity(Severity.MEDIUM)))
+        issues_after = sum(
+            1 for i in current_analysis.issues if i.severity in fixable
+        )
         
         fixes_applied.append({
             "iteration": iteration,
@@ -19,9 +19,13 @@ export MYTHRIL_DISABLE_SOLC_DOWNLOAD=1
 
 # Run with error handling
 # Capture output to check if JSON was produced
+# Two symbolic transactions cover the reentrancy/tx.origin/unchecked-send
+# class we screen for; the default explores deeper sequences and mostly
+# burns the execution timeout on Z3 queries
 OUTPUT=$(/usr/local/bin/myth analyze \
   $OPT_TIMEOUT \
   --max-depth 12 \
+  --transaction-count 2 \
   --solver-timeout 10000 \
   -o json \
   "$FILENAME" 2>&1)
@@ -4,6 +4,7 @@ Test script to verify Mythril and Slither are finding issues correctly
 
 import json
 from pathlib import Path
+from fast_json import load_report
 from stage_3 import run_stage3
 
 # Test with a known vulnerable contract
@@ -147,7 +148,9 @@ def test_results_generation():
         return
     
     # Find a sample stage3_report.json
-    sample_reports = list(results_dir.glob("*/stage3_report.json"))
+    sample_reports = sorted(results_dir.glob("*/stage3_report.json")) + sorted(
+        results_dir.glob("*/stage3_report.json.zst")
+    )
     if not sample_reports:
         print("⚠️  No stage3_report.json files found")
         print("   Run Stage 3 on some contracts first")
@@ -160,8 +163,7 @@ def test_results_generation():
     print(f"\nTesting with: {sample_report}")
     
     try:
-        with open(sample_report, 'r') as f:
-            data = json.load(f)
+        data = load_report(sample_report)
         
         initial = data.get("initial_analysis", {})
         issues = initial.get("issues", [])
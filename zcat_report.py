@@ -0,0 +1,21 @@
+"""
+Print a stage3 report (plain or zstd-compressed) to stdout.
+
+Usage:
+    python zcat_report.py pipeline_outputs/<run>/stage3_report.json.zst
+"""
+
+import sys
+
+from fast_json import dumps_pretty, load_report
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python zcat_report.py <stage3_report.json[.zst]>")
+        sys.exit(1)
+    sys.stdout.write(dumps_pretty(load_report(sys.argv[1])) + "\n")
+
+
+if __name__ == "__main__":
+    main()